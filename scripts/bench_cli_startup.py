@@ -0,0 +1,61 @@
+"""
+bench_cli_startup.py - Time CLI startup for lightweight subcommands
+
+Runs `python -m schooldata.cli list` / `status` in fresh interpreters and
+fails if the median wall time exceeds the budget. That these commands do
+not import the ingest stack is asserted by tests/test_cli.py.
+
+Usage:
+    python scripts/bench_cli_startup.py
+    python scripts/bench_cli_startup.py --runs 10 --budget-ms 300
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+SRC_DIR = Path(__file__).parent.parent / "src"
+
+
+def _env() -> dict:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(SRC_DIR), env.get("PYTHONPATH")]))
+    return env
+
+
+def time_command(command: str, runs: int) -> float:
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, "-m", "schooldata.cli", command],
+            capture_output=True, env=_env(), check=True,
+        )
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=400.0)
+    args = parser.parse_args()
+
+    failed = False
+    for command in ("list", "status"):
+        median_ms = time_command(command, args.runs)
+        ok = median_ms <= args.budget_ms
+        failed |= not ok
+        print(f"{command:>7s}: {median_ms:7.1f} ms  {'OK' if ok else 'FAIL'}")
+
+    if failed:
+        print(f"\nStartup benchmark failed (budget {args.budget_ms:.0f} ms).")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
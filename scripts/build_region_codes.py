@@ -0,0 +1,103 @@
+"""
+build_region_codes.py - Compile data/sido_sggCode.xlsx into the binary code table
+
+Reads the 시도/시군구 code sheet once (stdlib only, no openpyxl) and writes
+src/schooldata/region_codes.bin, which schooldata.regions loads at runtime
+without any xlsx parsing. Re-run whenever the xlsx changes.
+
+Usage:
+    python scripts/build_region_codes.py
+
+Binary layout (little-endian, every section 4-byte aligned):
+    magic  b"SGGC" | version u32 | n_sido u32 | n_sgg u32
+    sido_codes   i32[n_sido]
+    sido_names   u32[n_sido + 1]   offsets into the string blob
+    sgg_codes    i32[n_sgg]        ascending
+    sgg_sido     i32[n_sgg]        index into sido_codes
+    sgg_names    u32[n_sgg + 1]    offsets into the string blob
+    blob         UTF-8 names
+"""
+
+import re
+import struct
+import sys
+import zipfile
+import xml.etree.ElementTree as ET
+from array import array
+from pathlib import Path
+
+XLSX_PATH = Path(__file__).parent.parent / "data" / "sido_sggCode.xlsx"
+OUT_PATH = Path(__file__).parent.parent / "src" / "schooldata" / "region_codes.bin"
+
+MAGIC = b"SGGC"
+VERSION = 1
+HEADER = ("시도명", "시도코드", "시군구명", "시군구코드")
+_NS = {"m": "http://schemas.openxmlformats.org/spreadsheetml/2006/main"}
+
+
+def read_rows(path: Path) -> list[tuple[str, ...]]:
+    """Rows of the first sheet as tuples of cell text."""
+    with zipfile.ZipFile(path) as z:
+        shared = [
+            "".join(t.text or "" for t in si.iter(f"{{{_NS['m']}}}t"))
+            for si in ET.fromstring(z.read("xl/sharedStrings.xml")).findall("m:si", _NS)
+        ]
+        sheet = ET.fromstring(z.read("xl/worksheets/sheet1.xml"))
+
+    rows = []
+    for row in sheet.find("m:sheetData", _NS):
+        cells = {}
+        for c in row:
+            v = c.find("m:v", _NS)
+            if v is None:
+                continue
+            col = re.sub(r"\d", "", c.get("r"))
+            cells[col] = shared[int(v.text)] if c.get("t") == "s" else v.text
+        rows.append(tuple(cells.get(col, "") for col in "ABCD"))
+    return rows
+
+
+def main():
+    rows = read_rows(XLSX_PATH)
+    start = rows.index(HEADER) + 1
+    records = sorted(
+        {(int(sgg_code), sido_name.strip(), int(sido_code), sgg_name.strip())
+         for sido_name, sido_code, sgg_name, sgg_code in rows[start:] if sgg_code.strip()}
+    )
+
+    sidos = sorted({(code, name) for _, name, code, _ in records})
+    sido_index = {code: i for i, (code, _) in enumerate(sidos)}
+
+    blob = bytearray()
+
+    def add_names(names):
+        offsets = array("I", [0] * (len(names) + 1))
+        for i, name in enumerate(names):
+            offsets[i] = len(blob)
+            blob.extend(name.encode("utf-8"))
+        offsets[len(names)] = len(blob)
+        return offsets
+
+    sido_offsets = add_names([name for _, name in sidos])
+    sgg_offsets = add_names([sgg_name for _, _, _, sgg_name in records])
+
+    sections = [
+        array("i", [code for code, _ in sidos]),
+        sido_offsets,
+        array("i", [sgg_code for sgg_code, _, _, _ in records]),
+        array("i", [sido_index[sido_code] for _, _, sido_code, _ in records]),
+        sgg_offsets,
+    ]
+    out = bytearray(MAGIC + struct.pack("<III", VERSION, len(sidos), len(records)))
+    for section in sections:
+        if sys.byteorder == "big":
+            section.byteswap()
+        out.extend(section.tobytes())
+    out.extend(blob)
+
+    OUT_PATH.write_bytes(bytes(out))
+    print(f"{len(sidos)} 시도, {len(records)} 시군구 → {OUT_PATH} ({len(out)} bytes)")
+
+
+if __name__ == "__main__":
+    main()
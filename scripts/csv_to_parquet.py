@@ -1,17 +1,23 @@
 """
 csv_to_parquet.py - Convert CSV files from data/csvs/ into data/raw_parquets/
 
+Each Parquet file gets a column statistics sidecar (<name>.stats.json)
+computed in the same pass, see schooldata.stats.
+
 Usage:
     python scripts/csv_to_parquet.py
 
 Requirements:
     pip install polars pyarrow
+    pip install -e .    # for schooldata.stats
 """
 
 import io
 import polars as pl
 from pathlib import Path
 
+from schooldata.stats import write_stats
+
 CSVS_DIR = Path(__file__).parent.parent / "data" / "csvs"
 PARQUETS_DIR = Path(__file__).parent.parent / "data" / "raw_parquets"
 
@@ -41,12 +47,13 @@ def main():
             text = csv_path.read_bytes().decode("cp949")
             df = pl.read_csv(io.StringIO(text), infer_schema_length=10000, ignore_errors=True)
         df.write_parquet(out_path, compression="zstd")
+        write_stats(df.to_arrow(), out_path)
 
         parquet_mb = out_path.stat().st_size / (1024 * 1024)
         ratio = csv_mb / parquet_mb
         print(f"  -> {out_path.name} ({parquet_mb:.1f} MB, {ratio:.1f}x smaller)\n")
 
-    print("Done. Parquet files are in data/raw_parquets/")
+    print("Done. Parquet files (+ .stats.json sidecars) are in data/raw_parquets/")
     print("Note: data/raw_parquets/ is gitignored — these files stay local only.")
 
 
@@ -7,6 +7,7 @@ Usage::
     client = SchoolInfoClient(api_key="YOUR_KEY")
     rows = client.fetch("0", sido_code="11")        # 서울 학교기본정보
     rows = client.fetch_all_regions("0")             # 전국 학교기본정보
+    rows = client.fetch_all_sgg("0", sido_code="11") # 서울, 시군구 단위로 분할
 """
 
 from __future__ import annotations
@@ -17,7 +18,7 @@ from typing import Any
 
 import httpx
 
-from schooldata.codes import SIDO_CODES, SCHOOL_KIND_CODES
+from schooldata.codes import SIDO_CODE_BY_NAME, SIDO_CODES, SCHOOL_KIND_CODES
 from schooldata.config import API_KEY, BASE_URL
 
 logger = logging.getLogger(__name__)
@@ -90,6 +91,48 @@ class SchoolInfoClient:
         logger.info("Total rows for apiType=%s: %d", api_type, len(all_rows))
         return all_rows
 
+    def fetch_all_sgg(
+        self,
+        api_type: str,
+        *,
+        sido_code: str | None = None,
+        school_kind: str | None = None,
+        delay: float = 0.3,
+    ) -> list[dict[str, Any]]:
+        """Shard a crawl by 시군구코드 (all regions, or one 시도).
+
+        *sido_code* uses the ``SIDO_CODES`` form, like the other helpers
+        (부산 "21"), and is what every call sends as ``sidoCode``.
+        시군구코드 come from the compiled ``region_codes.bin`` table, whose
+        시도 prefixes are a different numbering (부산 26), so 시도 are
+        matched between the two by name. Raises ValueError for a code not
+        in ``SIDO_CODES``.
+        """
+        from schooldata import regions
+
+        prefix = None
+        if sido_code is not None:
+            if sido_code not in SIDO_CODES:
+                raise ValueError(f"Unknown 시도코드 {sido_code!r}; expected one of {sorted(SIDO_CODES)}")
+            prefix = regions.sido_code(SIDO_CODES[sido_code])
+            if prefix is None:
+                raise ValueError(f"{SIDO_CODES[sido_code]} is not in the region code table")
+
+        all_rows: list[dict[str, Any]] = []
+        for sgg_code in regions.sgg_codes(prefix):
+            sido_name, name = regions.sgg_name(sgg_code)
+            logger.info("Fetching apiType=%s  sgg=%s (%s %s)", api_type, sgg_code, sido_name, name)
+            rows = self.fetch(
+                api_type, sido_code=SIDO_CODE_BY_NAME.get(sido_name), sgg_code=sgg_code,
+                school_kind=school_kind,
+            )
+            all_rows.extend(rows)
+            logger.info("  → %d rows", len(rows))
+            if delay > 0:
+                time.sleep(delay)
+        logger.info("Total rows for apiType=%s: %d", api_type, len(all_rows))
+        return all_rows
+
     def fetch_all_school_kinds(
         self,
         api_type: str,
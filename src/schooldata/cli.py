@@ -9,11 +9,27 @@ Usage::
     # Load from CSV
     python -m schooldata.cli csv -t 0 --year 2021 --file path/to/data.csv
 
+    # Load a multi-year EDSS CSV, split by 조사년도 in one streaming pass
+    python -m schooldata.cli csv -t 유초중등학생현황 --file "data/csvs/유초중등학생현황(09-23).csv"
+
     # Show loaded datasets
     python -m schooldata.cli status
 
     # List available API types and codes
     python -m schooldata.cli list
+
+    # Build the per-school history store from data/raw_parquets/
+    python -m schooldata.cli build-history
+
+    # Rebuild the stratified samples used by db.approx_aggregate
+    python -m schooldata.cli build-samples
+
+    # Publish a read-only DuckDB snapshot for dashboard workers
+    python -m schooldata.cli publish
+    python -m schooldata.cli api -t 0 --year 2026 --publish
+
+Each handler imports what it needs inside its body, so ``list``/``status``
+never import pandas, pyarrow, httpx or dotenv.
 """
 
 from __future__ import annotations
@@ -21,9 +37,106 @@ from __future__ import annotations
 import argparse
 import logging
 import sys
+from typing import Callable
+
+# ── Handlers ───────────────────────────────────────────────────
+
+def _cmd_list(args: argparse.Namespace) -> None:
+    from schooldata.codes import API_TYPES, SIDO_CODES
+
+    print("\n=== API Types ===")
+    for code, name in sorted(API_TYPES.items(), key=lambda x: int(x[0])):
+        print(f"  {code:>3s}  {name}")
+    print("\n=== 시도코드 ===")
+    for code, name in sorted(SIDO_CODES.items()):
+        print(f"  {code}  {name}")
+
+
+def _cmd_status(args: argparse.Namespace) -> None:
+    from schooldata.manifest import show_manifest
+
+    show_manifest()
+
+
+def _cmd_api(args: argparse.Namespace) -> None:
+    from schooldata.loader import load_from_api
+    from schooldata.manifest import show_manifest
+
+    path = load_from_api(
+        args.api_type,
+        year=args.year,
+        sido_code=args.sido,
+        school_kind=args.school_kind,
+        api_key=args.api_key,
+    )
+    print(f"\n✓ Written → {path}")
+    show_manifest()
+    if args.publish:
+        _cmd_publish(args)
+
+
+def _cmd_csv(args: argparse.Namespace) -> None:
+    from schooldata.loader import load_from_csv, load_from_csv_by_year
+    from schooldata.manifest import show_manifest
+
+    if args.year is None:
+        paths = load_from_csv_by_year(
+            args.api_type,
+            args.file,
+            encoding=args.encoding,
+            year_column=args.year_column,
+        )
+        for year, path in paths.items():
+            print(f"  {year} → {path}")
+        print(f"\n✓ Written {len(paths)} year(s)")
+    else:
+        path = load_from_csv(
+            args.api_type,
+            args.file,
+            year=args.year,
+            encoding=args.encoding,
+        )
+        print(f"\n✓ Written → {path}")
+    show_manifest()
+    if args.publish:
+        _cmd_publish(args)
 
-from schooldata.codes import API_TYPES, SIDO_CODES
-from schooldata.loader import load_from_api, load_from_csv, show_manifest
+
+def _cmd_build_history(args: argparse.Namespace) -> None:
+    from schooldata.db import build_school_history
+
+    built = build_school_history()
+    for table, count in built.items():
+        print(f"  {table}: {count} rows")
+    print(f"\n✓ {len(built)} history table(s) built")
+
+
+def _cmd_publish(args: argparse.Namespace) -> None:
+    from schooldata.snapshot import publish_snapshot
+
+    path = publish_snapshot()
+    print(f"\n✓ Published snapshot → {path}")
+
+
+def _cmd_build_samples(args: argparse.Namespace) -> None:
+    from schooldata.db import build_all_samples
+
+    built = build_all_samples()
+    for table in built:
+        print(f"  {table}")
+    print(f"\n✓ {len(built)} sample table(s) built")
+
+
+# ── Subcommand registry ────────────────────────────────────────
+_COMMANDS: dict[str, Callable[[argparse.Namespace], None]] = {
+    "api": _cmd_api,
+    "csv": _cmd_csv,
+    "status": _cmd_status,
+    "list": _cmd_list,
+    "build-history": _cmd_build_history,
+    "build-samples": _cmd_build_samples,
+    "publish": _cmd_publish,
+}
 
 
 def main(argv: list[str] | None = None) -> None:
@@ -43,13 +156,16 @@ def main(argv: list[str] | None = None) -> None:
     p_api.add_argument("-s", "--sido", help="시도코드 (omit for all regions)")
     p_api.add_argument("-k", "--school-kind", help="학교급구분코드")
     p_api.add_argument("--api-key", help="Override API key")
+    p_api.add_argument("--publish", action="store_true", help="Publish a snapshot after ingest")
 
     # ── csv subcommand ─────────────────────────────────────────
     p_csv = sub.add_parser("csv", help="Load legacy CSV → Parquet")
     p_csv.add_argument("-t", "--api-type", required=True, help="API type code (e.g. 0)")
-    p_csv.add_argument("--year", type=int, required=True, help="Data year (e.g. 2021)")
+    p_csv.add_argument("--year", type=int, help="Data year (e.g. 2021); omit to split by --year-column")
     p_csv.add_argument("-f", "--file", required=True, help="Path to CSV file")
     p_csv.add_argument("--encoding", default="utf-8", help="CSV encoding (default: utf-8)")
+    p_csv.add_argument("--year-column", default="조사년도", help="Year column for split mode (default: 조사년도)")
+    p_csv.add_argument("--publish", action="store_true", help="Publish a snapshot after ingest")
 
     # ── status subcommand ──────────────────────────────────────
     sub.add_parser("status", help="Show loaded datasets from manifest")
@@ -57,6 +173,15 @@ def main(argv: list[str] | None = None) -> None:
     # ── list subcommand ────────────────────────────────────────
     sub.add_parser("list", help="List available API types and 시도코드")
 
+    # ── build-history subcommand ───────────────────────────────
+    sub.add_parser("build-history", help="Build per-school history store from raw Parquet")
+
+    # ── build-samples subcommand ───────────────────────────────
+    sub.add_parser("build-samples", help="Build stratified samples for approximate queries")
+
+    # ── publish subcommand ─────────────────────────────────────
+    sub.add_parser("publish", help="Publish a versioned read-only DuckDB snapshot")
+
     args = parser.parse_args(argv)
 
     logging.basicConfig(
@@ -64,42 +189,12 @@ def main(argv: list[str] | None = None) -> None:
         format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
     )
 
-    if args.command == "list":
-        print("\n=== API Types ===")
-        for code, name in sorted(API_TYPES.items(), key=lambda x: int(x[0])):
-            print(f"  {code:>3s}  {name}")
-        print("\n=== 시도코드 ===")
-        for code, name in sorted(SIDO_CODES.items()):
-            print(f"  {code}  {name}")
-
-    elif args.command == "api":
-        path = load_from_api(
-            args.api_type,
-            year=args.year,
-            sido_code=args.sido,
-            school_kind=args.school_kind,
-            api_key=args.api_key,
-        )
-        print(f"\n✓ Written → {path}")
-        show_manifest()
-
-    elif args.command == "csv":
-        path = load_from_csv(
-            args.api_type,
-            args.file,
-            year=args.year,
-            encoding=args.encoding,
-        )
-        print(f"\n✓ Written → {path}")
-        show_manifest()
-
-    elif args.command == "status":
-        show_manifest()
-
-    else:
+    if args.command not in _COMMANDS:
         parser.print_help()
         sys.exit(1)
 
+    _COMMANDS[args.command](args)
+
 
 if __name__ == "__main__":
     main()
@@ -2,11 +2,16 @@
 
 시도코드·시군구코드·학교급구분코드 정의.
 시군구코드 전체 목록은 학교알리미 API이용안내 > 시도시군구코드.xlsx 참고.
+컴파일된 시군구코드 조회는 ``schooldata.regions`` 사용.
 """
 
 from __future__ import annotations
 
 # ── 시도코드 (sidoCode) ────────────────────────────────────────
+# The only numbering the client sends as ``sidoCode``. The 시도시군구코드.xlsx
+# compiled into ``regions`` numbers 시도 differently (부산 26 there, 울산 26
+# here); its codes are only ever sent as ``sggCode``. Map between the two by
+# 시도명 (SIDO_CODE_BY_NAME / ``regions.sido_code``), never by number.
 SIDO_CODES: dict[str, str] = {
     "11": "서울특별시",
     "21": "부산광역시",
@@ -27,6 +32,8 @@ SIDO_CODES: dict[str, str] = {
     "35": "전북특별자치도",
 }
 
+SIDO_CODE_BY_NAME: dict[str, str] = {name: code for code, name in SIDO_CODES.items()}
+
 # ── 학교급구분코드 (schulKndCode) ──────────────────────────────
 SCHOOL_KIND_CODES: dict[str, str] = {
     "01": "유치원",
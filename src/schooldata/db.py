@@ -9,20 +9,44 @@ Usage::
     con = get_connection()
     df = query(con, "학교기본정보", "SELECT * FROM data WHERE SCHUL_KND_SC_NM = '초등학교'")
     list_datasets(con)
+
+    # Per-school 15-year history across the EDSS datasets
+    build_school_history()
+    school_history(7010057)   # {"유초중등학교개황": DataFrame, ...}
+
+    # Filter metadata from stats sidecars — no data scan
+    distinct_values("학교기본정보", "LCTN_SC_NM")
+    column_range("유초중등학교개황", "유초중등학교개황_학생수", raw=True)
+
+    # Approximate aggregates from a stratified sample; exact result follows
+    build_sample("유초중등학생현황", raw=True)     # once, after ingest
+    est, exact = approx_aggregate("유초중등학생현황", "학생수", by=["조사년도"], raw=True)
+    exact.result()            # blocks until the full scan finishes
 """
 
 from __future__ import annotations
 
+import json
 import logging
+import re
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timezone
 from pathlib import Path
 
 import duckdb
+import pandas as pd
 
-from schooldata.config import PROJECT_ROOT
+from schooldata.config import DUCKDB_PATH, PROJECT_ROOT
+from schooldata.stats import merge_stats, read_stats, stats_path
 
 logger = logging.getLogger(__name__)
 
 PARQUET_DIR = PROJECT_ROOT / "data" / "parquet"
+RAW_PARQUET_DIR = PROJECT_ROOT / "data" / "raw_parquets"
+
+# EDSS composite key shared by all five datasets
+SCHOOL_KEY = "학교ID"
+YEAR_KEY = "조사년도"
 
 
 def get_connection() -> duckdb.DuckDBPyConnection:
@@ -30,10 +54,10 @@ def get_connection() -> duckdb.DuckDBPyConnection:
     return duckdb.connect(":memory:")
 
 
-def _parquet_glob(dataset: str, year: int | None = None) -> str:
+def _parquet_glob(dataset: str, year: int | None = None, parquet_dir: str | Path | None = None) -> str:
     """Build a glob path for read_parquet()."""
     safe = dataset.replace("/", "_").replace(" ", "_")
-    base = PARQUET_DIR / safe
+    base = Path(parquet_dir or PARQUET_DIR) / safe
     if year:
         return str(base / f"{year}.parquet")
     return str(base / "*.parquet")
@@ -122,3 +146,493 @@ def list_datasets(con: duckdb.DuckDBPyConnection | None = None) -> list[dict]:
             "total_rows": total_rows,
         })
     return results
+
+
+# ── Column statistics ──────────────────────────────────────────
+# Answered from the .stats.json sidecars written at ingest time.
+
+def dataset_files(
+    dataset: str,
+    year: int | None = None,
+    *,
+    raw: bool = False,
+    parquet_dir: str | Path | None = None,
+    raw_dir: str | Path | None = None,
+) -> list[Path]:
+    """Parquet files of a dataset, or with ``raw=True`` the EDSS raw file
+    whose table name (see :func:`_edss_table_name`) equals *dataset*.
+
+    *parquet_dir* / *raw_dir* default to ``PARQUET_DIR`` / ``RAW_PARQUET_DIR``.
+    """
+    if raw:
+        files = sorted(
+            f for f in Path(raw_dir or RAW_PARQUET_DIR).glob("*.parquet")
+            if _edss_table_name(f.stem) == dataset
+        )
+        if len(files) > 1:
+            raise ValueError(f"Ambiguous EDSS dataset {dataset!r}: {[f.name for f in files]}")
+        return files
+    glob = Path(_parquet_glob(dataset, year, parquet_dir))
+    return sorted(glob.parent.glob(glob.name))
+
+
+def dataset_stats(
+    dataset: str,
+    *,
+    year: int | None = None,
+    raw: bool = False,
+    parquet_dir: str | Path | None = None,
+    raw_dir: str | Path | None = None,
+) -> dict:
+    """Merge the stats sidecars of a dataset without reading any data.
+
+    Parameters
+    ----------
+    dataset : str
+        Dataset name (Parquet subdirectory), or with ``raw=True`` the table
+        name of an EDSS file in ``data/raw_parquets/`` (e.g. "공통_학교속성").
+    year : int, optional
+        Restrict to a single year's file (processed datasets only).
+    parquet_dir, raw_dir : path, optional
+        Read from these directories instead of the defaults.
+
+    Returns
+    -------
+    dict
+        ``{"row_count", "columns": {name: {null_count, min, max,
+        distinct | hll, approx_distinct}}}``.
+    """
+    files = [
+        f for f in dataset_files(dataset, year, raw=raw, parquet_dir=parquet_dir, raw_dir=raw_dir)
+        if stats_path(f).exists()
+    ]
+    if not files:
+        raise FileNotFoundError(f"No stats sidecars for dataset {dataset!r}")
+    return merge_stats([read_stats(f) for f in files])
+
+
+def _column(dataset: str, column: str, **kwargs) -> dict:
+    cols = dataset_stats(dataset, **kwargs)["columns"]
+    if column not in cols:
+        raise KeyError(f"Column {column!r} not in dataset {dataset!r}")
+    return cols[column]
+
+
+def distinct_values(dataset: str, column: str, **kwargs) -> list | None:
+    """Distinct values of a low-cardinality column, or None if only sketched."""
+    return _column(dataset, column, **kwargs).get("distinct")
+
+
+def column_range(dataset: str, column: str, **kwargs) -> tuple:
+    """``(min, max)`` of a column across the dataset's files."""
+    col = _column(dataset, column, **kwargs)
+    return col.get("min"), col.get("max")
+
+
+# ── School-history store ───────────────────────────────────────
+# A persistent DuckDB file holding each EDSS dataset as a table sorted by
+# (학교ID, 조사년도). The sort keeps each school's rows contiguous, so the
+# per-row-group min/max zonemaps let a 학교ID = ? filter skip all but one
+# or two row groups instead of scanning five full Parquet files. There is
+# deliberately no index: DuckDB plans these point lookups as sequential
+# scans either way (EXPLAIN shows SEQ_SCAN even with an ART index on 학교ID).
+# Tables live in their own schema so they never collide with same-named
+# datasets materialized next to them (see schooldata.snapshot).
+
+HISTORY_SCHEMA = "history"
+_HISTORY_REGISTRY = f"{HISTORY_SCHEMA}._registry"
+
+
+def _edss_table_name(stem: str) -> str:
+    """``0002. 유초중등학교개황(09-23)(100%)`` → ``유초중등학교개황``."""
+    name = re.sub(r"^\d+\.\s*", "", stem)
+    name = re.sub(r"\(.*$", "", name)
+    return name.strip().replace(" ", "_") or stem
+
+
+def build_school_history(
+    db_path: str | Path = DUCKDB_PATH,
+    raw_dir: str | Path = RAW_PARQUET_DIR,
+) -> dict[str, int]:
+    """(Re)build the school-history tables from the EDSS raw Parquet files.
+
+    Returns ``{table_name: row_count}``.
+    """
+    files = sorted(Path(raw_dir).glob("*.parquet"))
+    if not files:
+        logger.warning("No raw Parquet files in %s", raw_dir)
+        return {}
+
+    Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+    built: dict[str, int] = {}
+    with duckdb.connect(str(db_path)) as con:
+        con.execute(f"CREATE SCHEMA IF NOT EXISTS {HISTORY_SCHEMA}")
+        con.execute(f"""
+            CREATE TABLE IF NOT EXISTS {_HISTORY_REGISTRY} (
+                dataset VARCHAR PRIMARY KEY,
+                source VARCHAR,
+                row_count BIGINT,
+                built_at VARCHAR
+            )
+        """)
+        for f in files:
+            cols = {r[0] for r in con.sql(f"DESCRIBE SELECT * FROM read_parquet('{f}')").fetchall()}
+            if not {SCHOOL_KEY, YEAR_KEY} <= cols:
+                logger.info("Skipping %s (no %s/%s columns)", f.name, SCHOOL_KEY, YEAR_KEY)
+                continue
+
+            table = _edss_table_name(f.stem)
+            qualified = f'{HISTORY_SCHEMA}."{table}"'
+            # The physical order is what makes lookups cheap (zonemap pruning)
+            con.execute(f"DROP TABLE IF EXISTS {qualified}")
+            con.execute(f"""
+                CREATE TABLE {qualified} AS
+                SELECT * FROM read_parquet('{f}')
+                ORDER BY "{SCHOOL_KEY}", "{YEAR_KEY}"
+            """)
+            count = con.sql(f"SELECT COUNT(*) FROM {qualified}").fetchone()[0]
+            con.execute(
+                f"INSERT OR REPLACE INTO {_HISTORY_REGISTRY} VALUES (?, ?, ?, ?)",
+                [table, f.name, count, datetime.now(timezone.utc).isoformat()],
+            )
+            built[table] = count
+            logger.info("History table %s: %d rows ← %s", table, count, f.name)
+    return built
+
+
+def get_history_connection(db_path: str | Path = DUCKDB_PATH) -> duckdb.DuckDBPyConnection:
+    """Open the school-history store read-only (safe to share across readers)."""
+    return duckdb.connect(str(db_path), read_only=True)
+
+
+def history_tables(con: duckdb.DuckDBPyConnection) -> list[str]:
+    """Names of the tables registered by :func:`build_school_history`
+    (in the ``history`` schema)."""
+    return [r[0] for r in con.sql(f"SELECT dataset FROM {_HISTORY_REGISTRY} ORDER BY dataset").fetchall()]
+
+
+def school_history(
+    school_id: int,
+    con: duckdb.DuckDBPyConnection | None = None,
+    *,
+    datasets: list[str] | None = None,
+) -> dict:
+    """Return the complete timeline of one 학교ID across the EDSS datasets.
+
+    Parameters
+    ----------
+    school_id : int
+        ``학교ID`` value.
+    con : DuckDBPyConnection, optional
+        Connection from :func:`get_history_connection`. Reuse one connection
+        for repeated lookups; opening the file dominates a single lookup,
+        which itself only reads the row groups whose 학교ID range covers
+        *school_id*.
+    datasets : list[str], optional
+        Restrict to these history tables (default: all).
+
+    Returns
+    -------
+    dict[str, pd.DataFrame]
+        Rows ordered by ``조사년도``, keyed by table name.
+    """
+    own = con is None
+    if own:
+        con = get_history_connection()
+    try:
+        result = {}
+        for table in datasets or history_tables(con):
+            result[table] = con.execute(
+                f'SELECT * FROM {HISTORY_SCHEMA}."{table}" WHERE "{SCHOOL_KEY}" = ? ORDER BY "{YEAR_KEY}"',
+                [school_id],
+            ).df()
+        return result
+    finally:
+        if own:
+            con.close()
+
+
+# ── Approximate queries ────────────────────────────────────────
+# Stratified samples per (조사년도, 시도명, 학교급) stored in their own DuckDB
+# file (SAMPLE_DB_PATH), so building them never conflicts with read-only
+# connections to DUCKDB_PATH. Samples are built explicitly after ingest
+# (build_sample / build_all_samples); the query path only reads them.
+# Within each stratum, rows flagged 70%추출 = 'Y' are taken first, ordered by
+# a hash of 학교ID so the same schools stay in the sample across years
+# (stable trend lines). Estimates treat each stratum as a simple random
+# sample, weighted by N_h / n_h. EDSS raw samples live in their own schema
+# so they never collide with a same-named processed dataset's sample.
+
+SAMPLE_DB_PATH = DUCKDB_PATH.with_name("samples.duckdb")
+SAMPLE_FLAG = "70%추출"
+SAMPLE_FLAG_VALUE = "Y"
+
+# Each stratum dimension, with column names to try in order
+# (EDSS Korean headers first, then the API field names).
+_STRATA_CANDIDATES: tuple[tuple[str, ...], ...] = (
+    ("조사년도", "data_year"),
+    ("시도명", "LCTN_SC_NM"),
+    ("학교급명", "학제명", "SCHUL_KND_SC_NM"),
+)
+_SAMPLE_KEYS = (SCHOOL_KEY, "SCHUL_CODE")
+_SAMPLE_REGISTRY = "_samples"
+_SAMPLE_SCHEMAS = {True: "raw", False: "main"}
+
+_APPROX_COLUMNS = ["estimate", "std_error", "ci_low", "ci_high", "sample_rows", "scale_factor"]
+
+_exact_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="exact-query")
+
+
+def parquet_source(files: list[Path]) -> str:
+    """``read_parquet(...)`` table expression over an explicit file list."""
+    paths = ", ".join(f"'{f}'" for f in files)
+    return f"read_parquet([{paths}], union_by_name=true)"
+
+
+def _sample_table(dataset: str, raw: bool) -> str:
+    """Schema-qualified sample table; also its key in the registry."""
+    name = _edss_table_name(dataset) if raw else dataset.replace("/", "_").replace(" ", "_")
+    return f'{_SAMPLE_SCHEMAS[raw]}."_sample_{name}"'
+
+
+def build_sample(
+    dataset: str,
+    *,
+    raw: bool = False,
+    fraction: float = 0.1,
+    min_per_stratum: int = 20,
+    db_path: str | Path = SAMPLE_DB_PATH,
+) -> str:
+    """(Re)build the stratified sample table for a dataset.
+
+    Each stratum keeps ``max(min_per_stratum, ceil(fraction * N_h))`` rows
+    (or all of them, if fewer). Opens *db_path* read-write, so run it as a
+    separate step after ingest. Returns the schema-qualified sample table
+    (``raw."_sample_…"`` for EDSS files, ``main."_sample_…"`` otherwise).
+    """
+    files = dataset_files(dataset, raw=raw)
+    if not files:
+        raise FileNotFoundError(f"No Parquet files for dataset {dataset!r}")
+    src = parquet_source(files)
+    table = _sample_table(dataset, raw)
+
+    Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+    with duckdb.connect(str(db_path)) as con:
+        cols = {r[0] for r in con.sql(f"DESCRIBE SELECT * FROM {src}").fetchall()}
+        strata = [next(c for c in cands if c in cols) for cands in _STRATA_CANDIDATES if any(c in cols for c in cands)]
+        if not strata:
+            raise ValueError(f"Dataset {dataset!r} has none of the strata columns")
+        part = ", ".join(f'"{c}"' for c in strata)
+
+        key = next((k for k in _SAMPLE_KEYS if k in cols), None)
+        order_key = f'hash("{key}")' if key else "random()"
+        flag_first = f"(\"{SAMPLE_FLAG}\" IS DISTINCT FROM '{SAMPLE_FLAG_VALUE}'), " if SAMPLE_FLAG in cols else ""
+
+        con.execute(f"CREATE SCHEMA IF NOT EXISTS {_SAMPLE_SCHEMAS[raw]}")
+        con.execute(f"DROP TABLE IF EXISTS {table}")
+        con.execute(f"""
+            CREATE TABLE {table} AS
+            WITH ranked AS (
+                SELECT *,
+                       COUNT(*) OVER (PARTITION BY {part}) AS _stratum_rows,
+                       ROW_NUMBER() OVER (PARTITION BY {part} ORDER BY {flag_first}{order_key}) AS _rk
+                FROM {src}
+            ),
+            kept AS (
+                SELECT * EXCLUDE (_rk) FROM ranked
+                WHERE _rk <= GREATEST({int(min_per_stratum)}, CEIL({float(fraction)} * _stratum_rows))
+            )
+            SELECT *, COUNT(*) OVER (PARTITION BY {part}) AS _sample_rows FROM kept
+        """)
+        con.execute(f"""
+            CREATE TABLE IF NOT EXISTS {_SAMPLE_REGISTRY} (
+                name VARCHAR PRIMARY KEY,
+                strata JSON,
+                source_mtime DOUBLE,
+                fraction DOUBLE,
+                built_at VARCHAR
+            )
+        """)
+        con.execute(
+            f"INSERT OR REPLACE INTO {_SAMPLE_REGISTRY} VALUES (?, ?, ?, ?, ?)",
+            [table, json.dumps(strata, ensure_ascii=False), max(f.stat().st_mtime for f in files),
+             fraction, datetime.now(timezone.utc).isoformat()],
+        )
+        n = con.sql(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+    logger.info("Sample %s: %d rows, strata=%s", table, n, strata)
+    return table
+
+
+def build_all_samples(db_path: str | Path = SAMPLE_DB_PATH) -> list[str]:
+    """Rebuild samples for every EDSS raw file and Parquet dataset that has
+    strata columns. Run after ingest/publish; queries never build samples."""
+    targets = [(_edss_table_name(f.stem), True) for f in sorted(RAW_PARQUET_DIR.glob("*.parquet"))]
+    if PARQUET_DIR.exists():
+        targets += [(d.name, False) for d in sorted(PARQUET_DIR.iterdir()) if d.is_dir()]
+    built = []
+    for dataset, raw in targets:
+        try:
+            built.append(build_sample(dataset, raw=raw, db_path=db_path))
+        except (ValueError, FileNotFoundError) as e:
+            logger.info("No sample for %s: %s", dataset, e)
+    return built
+
+
+def _sample_info(dataset: str, raw: bool, db_path: str | Path) -> tuple[str, list[str]]:
+    """Return (sample table, strata) from the sample store, read-only."""
+    table = _sample_table(dataset, raw)
+    row = None
+    if Path(db_path).exists():
+        with duckdb.connect(str(db_path), read_only=True) as con:
+            exists = con.execute(
+                "SELECT COUNT(*) FROM information_schema.tables WHERE table_name = ?",
+                [_SAMPLE_REGISTRY],
+            ).fetchone()[0]
+            if exists:
+                row = con.execute(
+                    f"SELECT strata, source_mtime FROM {_SAMPLE_REGISTRY} WHERE name = ?", [table],
+                ).fetchone()
+    if row is None:
+        raise FileNotFoundError(
+            f"No sample for {dataset!r} in {db_path}; run build_sample() or `cli build-samples`"
+        )
+    mtime = max((f.stat().st_mtime for f in dataset_files(dataset, raw=raw)), default=None)
+    if mtime is not None and mtime > row[1]:
+        logger.warning("Sample for %s is older than its source files; rebuild it", dataset)
+    return table, json.loads(row[0])
+
+
+def _agg_expr(column: str | None, agg: str) -> str:
+    if agg == "count":
+        return "1.0"
+    if column is None:
+        raise ValueError(f"agg={agg!r} needs a column")
+    return f'TRY_CAST("{column}" AS DOUBLE)'
+
+
+def _exact_aggregate(files: list[Path], column: str | None, agg: str, by: list[str], where: str | None) -> pd.DataFrame:
+    fn = {"count": "COUNT(*)", "sum": "SUM", "mean": "AVG"}[agg]
+    expr = fn if agg == "count" else f"{fn}({_agg_expr(column, agg)})"
+    group = ", ".join(f'"{c}"' for c in by)
+    sql = f"SELECT {group + ', ' if by else ''}{expr} AS exact FROM {parquet_source(files)}"
+    if where:
+        sql += f" WHERE {where}"
+    if by:
+        sql += f" GROUP BY {group} ORDER BY {group}"
+    with duckdb.connect(":memory:") as con:
+        return con.sql(sql).df()
+
+
+def approx_aggregate(
+    dataset: str,
+    column: str | None = None,
+    *,
+    agg: str = "mean",
+    by: list[str] | tuple[str, ...] = (),
+    where: str | None = None,
+    raw: bool = False,
+    exact: bool = True,
+    z: float = 1.96,
+    db_path: str | Path = SAMPLE_DB_PATH,
+) -> tuple[pd.DataFrame, Future | None]:
+    """Estimate ``agg(column)`` per group from the stratified sample.
+
+    Parameters
+    ----------
+    dataset : str
+        Dataset name, or an EDSS table name with ``raw=True``.
+    column : str, optional
+        Numeric column; not needed for ``agg="count"``.
+    agg : {"mean", "sum", "count"}
+    by : list[str]
+        Grouping columns (e.g. ``["조사년도"]`` for a trend line).
+    where : str, optional
+        SQL predicate applied to rows (domain estimation).
+    exact : bool
+        Also submit the exact full-scan query to a background thread.
+    z : float
+        Normal quantile for the confidence interval (1.96 → 95%).
+
+    Returns
+    -------
+    (pd.DataFrame, Future | None)
+        Per group: ``estimate``, ``std_error``, ``ci_low``, ``ci_high``,
+        ``sample_rows`` and ``scale_factor`` (population rows represented
+        per sampled row). The future resolves to the exact DataFrame.
+    """
+    if agg not in ("mean", "sum", "count"):
+        raise ValueError(f"Unsupported agg: {agg!r}")
+    by = list(by)
+    table, strata = _sample_info(dataset, raw, db_path)
+
+    y = _agg_expr(column, agg)
+    keys = list(dict.fromkeys(by + strata))
+    group = ", ".join(f'"{c}"' for c in keys)
+    sql = f"""
+        SELECT {group},
+               ANY_VALUE(_stratum_rows)::DOUBLE AS pop_rows,
+               ANY_VALUE(_sample_rows)::DOUBLE AS samp_rows,
+               COUNT(_y)::DOUBLE AS cnt, SUM(_y) AS sy, SUM(_y * _y) AS sy2
+        FROM (SELECT *, {y} AS _y FROM {table} {f"WHERE {where}" if where else ""})
+        WHERE _y IS NOT NULL
+        GROUP BY {group}
+    """
+    with duckdb.connect(str(db_path), read_only=True) as con:
+        h = con.sql(sql).df()
+
+    future = None
+    if exact:
+        files = dataset_files(dataset, raw=raw)
+        future = _exact_pool.submit(_exact_aggregate, files, column, agg, by, where)
+
+    if h.empty:  # no sampled row in the domain
+        return pd.DataFrame(columns=by + _APPROX_COLUMNS), future
+
+    # Stratified (domain) estimators; rows outside the domain count as zero.
+    N, n = h["pop_rows"], h["samp_rows"]
+    fpc = 1.0 - n / N
+
+    def var_term(s1: pd.Series, s2: pd.Series) -> pd.Series:
+        s2_ = ((s2 - s1 ** 2 / n) / (n - 1)).where(n > 1, 0.0).clip(lower=0.0)
+        return N ** 2 * fpc * s2_ / n
+
+    w = N / n
+    h["_T"] = w * h["sy"]
+    h["_C"] = w * h["cnt"]
+    h["_vT"] = var_term(h["sy"], h["sy2"])
+    h["_vC"] = var_term(h["cnt"], h["cnt"])
+    gkey = by or (lambda _: 0)
+    g = h.groupby(gkey)
+    out = pd.DataFrame({
+        "T": g["_T"].sum(), "C": g["_C"].sum(),
+        "vT": g["_vT"].sum(), "vC": g["_vC"].sum(),
+        "sample_rows": g["cnt"].sum().astype(int),
+    })
+
+    if agg == "mean":
+        ratio = out["T"] / out["C"]
+        if by:
+            r = h[by].merge(ratio.rename("_R").reset_index(), on=by, how="left")["_R"].to_numpy()
+        else:
+            r = ratio.iloc[0]
+        d1 = h["sy"] - r * h["cnt"]
+        d2 = h["sy2"] - 2 * r * h["sy"] + r ** 2 * h["cnt"]
+        h["_vR"] = var_term(d1, d2)
+        out["estimate"] = ratio
+        out["variance"] = h.groupby(gkey)["_vR"].sum() / out["C"] ** 2
+    elif agg == "sum":
+        out["estimate"], out["variance"] = out["T"], out["vT"]
+    else:
+        out["estimate"], out["variance"] = out["C"], out["vC"]
+
+    se = out["variance"] ** 0.5
+    result = pd.DataFrame({
+        "estimate": out["estimate"],
+        "std_error": se,
+        "ci_low": out["estimate"] - z * se,
+        "ci_high": out["estimate"] + z * se,
+        "sample_rows": out["sample_rows"],
+        "scale_factor": out["C"] / out["sample_rows"],
+    })
+    result = result.reset_index() if by else result.reset_index(drop=True)
+    return result, future
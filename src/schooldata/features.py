@@ -0,0 +1,311 @@
+"""Region × year × feature matrix for the Step 8 scoreboard / clustering.
+
+Features are SQL aggregates over the Parquet datasets, grouped by region
+(시도) and year. The matrix is stored as a float32 ``.npy`` opened
+memory-mapped, with a JSON column index, under ``data/features/``.
+:meth:`FeatureStore.update` recomputes only the features whose input
+files changed, and :meth:`FeatureStore.score` re-scores every region for
+one or many weight vectors in a single vectorized call.
+
+KPI features follow the ROADMAP formulas: A is the year-over-year decline
+rate of entrants (%), C the after-school gap rate (%), H digital rooms per
+class. Rates whose denominator lives in another dataset (``per``) are
+joined on region and year after both sides are aggregated.
+
+Usage::
+
+    from schooldata.features import FeatureStore
+
+    store = FeatureStore()
+    store.update()                                  # incremental
+    X = store.matrix()                              # (regions, years, features) memmap
+    scores = store.score({"kpi_b_students_per_teacher": 1.0, "kpi_h_digital_rooms_per_class": -0.5})
+    batch = store.score(np.random.rand(len(store.features), 100))   # 100 weightings at once
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from pathlib import Path
+
+import duckdb
+import numpy as np
+import pandas as pd
+
+from schooldata.config import PROJECT_ROOT
+from schooldata.db import dataset_files, parquet_source
+
+logger = logging.getLogger(__name__)
+
+FEATURE_DIR = PROJECT_ROOT / "data" / "features"
+
+# ── Feature definitions ────────────────────────────────────────
+# name → dataset, aggregate expression, region/year columns.
+# raw=True reads the EDSS files in data/raw_parquets/ (시도명/조사년도);
+# otherwise the API datasets in data/parquet/ (LCTN_SC_NM/data_year).
+# Both use full 시도명 (서울특별시), so specs from either side join, but
+# only on years both cover: EDSS ends in 2023 while API datasets are
+# labelled by ingest year, so a missing overlap is logged, not filled.
+#   per   — denominator spec (same keys); value = expr / per
+#   rate  — "gap": (per - expr) / per × 100
+#           "decline": (last year - this year) / last year × 100
+# Extend as more KPI inputs are loaded.
+_EDSS_STUDENTS = {
+    "dataset": "유초중등학교개황",
+    "raw": True,
+    "expr": 'SUM("유초중등학교개황_학생수")',
+}
+_EDSS_CLASSES = {
+    "dataset": "유초중등학교개황",
+    "raw": True,
+    "expr": 'SUM("유초중등학교개황_학급수")',
+}
+
+FEATURES: dict[str, dict] = {
+    "kpi_a_entrant_decline_rate": {
+        "dataset": "입학생 현황",
+        "expr": "SUM(BEAGE_BOY_FGR + BEAGE_GIR_FGR)",
+        "where": "SCHUL_KND_SC_NM = '초등학교'",  # 초1 entrants
+        "rate": "decline",
+    },
+    "kpi_b_students_per_teacher": {
+        "dataset": "유초중등학교개황",
+        "raw": True,
+        "expr": 'SUM("유초중등학교개황_학생수") / NULLIF(SUM("유초중등학교개황_교원수"), 0)',
+    },
+    "kpi_c_afterschool_gap_rate": {
+        "dataset": "방과후학교 운영현황",
+        "expr": "SUM(ASL_PTPT_STDNT_FGR)",
+        "per": _EDSS_STUDENTS,
+        "rate": "gap",
+    },
+    "kpi_g_free_semester_hours": {
+        "dataset": "자유학기제 운영에 관한 사항",
+        "expr": "SUM(COL_4 + COL_5)",
+    },
+    "kpi_h_digital_rooms_per_class": {
+        "dataset": "교사(校舍) 현황",
+        "expr": "SUM(COM_CCCLA_FGR + MMA_CCCLA_FGR)",
+        "per": _EDSS_CLASSES,
+    },
+    "students": _EDSS_STUDENTS,
+}
+
+_REGION_COLUMNS = {True: "시도명", False: "LCTN_SC_NM"}
+_YEAR_COLUMNS = {True: "조사년도", False: "data_year"}
+
+
+def _signature(files: list[Path]) -> list:
+    """Change marker for a feature's inputs."""
+    return sorted([f.name, f.stat().st_mtime_ns, f.stat().st_size] for f in files)
+
+
+class FeatureStore:
+    """Memory-mapped float32 feature matrix with a column index."""
+
+    def __init__(self, root: str | Path = FEATURE_DIR, features: dict[str, dict] | None = None):
+        self.root = Path(root)
+        self.definitions = features if features is not None else FEATURES
+        self.matrix_path = self.root / "matrix.npy"
+        self.index_path = self.root / "index.json"
+        self.index = self._read_index()
+        self._normalized: np.ndarray | None = None
+
+    # ── index ──────────────────────────────────────────────────
+    def _read_index(self) -> dict:
+        if self.index_path.exists():
+            return json.loads(self.index_path.read_text(encoding="utf-8"))
+        return {"regions": [], "years": [], "features": [], "inputs": {}}
+
+    def _write_index(self) -> None:
+        tmp = self.index_path.with_suffix(".json.tmp")
+        tmp.write_text(json.dumps(self.index, ensure_ascii=False, indent=2), encoding="utf-8")
+        tmp.replace(self.index_path)
+
+    @property
+    def regions(self) -> list[str]:
+        return self.index["regions"]
+
+    @property
+    def years(self) -> list[int]:
+        return self.index["years"]
+
+    @property
+    def features(self) -> list[str]:
+        return self.index["features"]
+
+    # ── build / update ─────────────────────────────────────────
+    @staticmethod
+    def _inputs(spec: dict) -> list[Path] | None:
+        """Input files of a feature and its denominator; None if a side is missing."""
+        files = []
+        for part in (spec, spec.get("per")):
+            if part is None:
+                continue
+            found = dataset_files(part["dataset"], raw=part.get("raw", False))
+            if not found:
+                return None
+            files += found
+        return files
+
+    @staticmethod
+    def _aggregate(spec: dict) -> pd.DataFrame:
+        raw = spec.get("raw", False)
+        region = spec.get("region", _REGION_COLUMNS[raw])
+        year = spec.get("year", _YEAR_COLUMNS[raw])
+        files = dataset_files(spec["dataset"], raw=raw)
+        sql = f"""
+            SELECT CAST("{region}" AS VARCHAR) AS region,
+                   CAST("{year}" AS INTEGER) AS year,
+                   CAST({spec["expr"]} AS DOUBLE) AS value
+            FROM {parquet_source(files)}
+            {f"WHERE {spec['where']}" if spec.get("where") else ""}
+            GROUP BY 1, 2
+        """
+        with duckdb.connect(":memory:") as con:
+            return con.sql(sql).df()
+
+    def _compute(self, spec: dict) -> pd.DataFrame:
+        df = self._aggregate(spec)
+        if "per" in spec:
+            den = self._aggregate(spec["per"]).rename(columns={"value": "den"})
+            num_years, den_years = set(df["year"].dropna()), set(den["year"].dropna())
+            if num_years - den_years:
+                logger.warning(
+                    "%s / %s: no denominator for years %s (denominator covers %s)",
+                    spec["dataset"], spec["per"]["dataset"],
+                    sorted(int(y) for y in num_years - den_years),
+                    sorted(int(y) for y in den_years),
+                )
+            merged = df.merge(den, on=["region", "year"], how="inner")
+            if merged.empty and not df.empty:
+                logger.warning(
+                    "Feature on %s: join with %s left no (region, year) cells",
+                    spec["dataset"], spec["per"]["dataset"],
+                )
+            df = merged
+            df["den"] = df["den"].where(df["den"] != 0)
+            ratio = df["value"] / df["den"]
+            df["value"] = (1 - ratio) * 100 if spec.get("rate") == "gap" else ratio
+            df = df.drop(columns="den")
+        if spec.get("rate") == "decline":
+            df = df.sort_values(["region", "year"])
+            prev = df.groupby("region")[["year", "value"]].shift()
+            prev_value = prev["value"].where((prev["year"] == df["year"] - 1) & (prev["value"] != 0))
+            df["value"] = (prev_value - df["value"]) / prev_value * 100
+        return df[["region", "year", "value"]]
+
+    def update(self, *, force: bool = False) -> list[str]:
+        """Recompute features whose input files changed. Returns their names."""
+        self.root.mkdir(parents=True, exist_ok=True)
+        fresh: dict[str, pd.DataFrame] = {}
+        signatures: dict[str, list] = {}
+        for name, spec in self.definitions.items():
+            files = self._inputs(spec)
+            if not files:
+                logger.info("Feature %s: no input files for %s, skipped", name, spec["dataset"])
+                continue
+            sig = _signature(files)
+            if not force and name in self.features and self.index["inputs"].get(name) == sig:
+                continue
+            fresh[name] = self._compute(spec)
+            signatures[name] = sig
+            logger.info("Feature %s: recomputed (%d cells)", name, len(fresh[name]))
+
+        if not fresh:
+            return []
+
+        regions = sorted(set(self.regions).union(*(df["region"].dropna() for df in fresh.values())))
+        years = sorted(set(self.years).union(*(
+            (int(y) for y in df["year"].dropna()) for df in fresh.values()
+        )))
+        features = self.features + [n for n in fresh if n not in self.features]
+        X = self._reshape(regions, years, features)
+
+        r_pos = {r: i for i, r in enumerate(regions)}
+        y_pos = {y: i for i, y in enumerate(years)}
+        for name, df in fresh.items():
+            df = df.dropna(subset=["region", "year"])
+            f = features.index(name)
+            X[:, :, f] = np.nan
+            X[df["region"].map(r_pos).to_numpy(), df["year"].astype(int).map(y_pos).to_numpy(), f] = (
+                df["value"].to_numpy(dtype=np.float32)
+            )
+        X.flush()
+        del X
+
+        self.index.update(regions=regions, years=years, features=features)
+        self.index["inputs"].update(signatures)
+        self._write_index()
+        self._normalized = None
+        return list(fresh)
+
+    def _reshape(self, regions: list[str], years: list[int], features: list[str]) -> np.memmap:
+        """Open the matrix for writing, growing it when new axes labels appear."""
+        shape = (len(regions), len(years), len(features))
+        old_shape = (len(self.regions), len(self.years), len(self.features))
+        if self.matrix_path.exists() and shape == old_shape:
+            return np.load(self.matrix_path, mmap_mode="r+")
+
+        tmp = self.matrix_path.with_suffix(".npy.tmp")
+        X = np.lib.format.open_memmap(tmp, mode="w+", dtype=np.float32, shape=shape)
+        X[:] = np.nan
+        if self.matrix_path.exists() and all(old_shape):
+            old = np.load(self.matrix_path, mmap_mode="r")
+            ri = [regions.index(r) for r in self.regions]
+            yi = [years.index(y) for y in self.years]
+            fi = [features.index(f) for f in self.features]
+            X[np.ix_(ri, yi, fi)] = old
+            del old
+        X.flush()
+        del X
+        tmp.replace(self.matrix_path)
+        return np.load(self.matrix_path, mmap_mode="r+")
+
+    # ── read / score ───────────────────────────────────────────
+    def matrix(self) -> np.memmap:
+        """The (regions, years, features) float32 matrix, memory-mapped read-only."""
+        if not self.matrix_path.exists():
+            raise FileNotFoundError(f"No feature matrix in {self.root}; run update() first")
+        return np.load(self.matrix_path, mmap_mode="r")
+
+    def frame(self, year: int) -> pd.DataFrame:
+        """One year's slice as a regions × features DataFrame."""
+        return pd.DataFrame(
+            self.matrix()[:, self.years.index(year), :],
+            index=self.regions,
+            columns=self.features,
+        )
+
+    def normalized(self) -> np.ndarray:
+        """Per-(year, feature) z-scores across regions; NaN → 0 (the mean)."""
+        if self._normalized is None:
+            X = np.asarray(self.matrix(), dtype=np.float32)
+            with np.errstate(invalid="ignore", divide="ignore"):
+                mean = np.nanmean(X, axis=0, keepdims=True)
+                std = np.nanstd(X, axis=0, keepdims=True)
+                Z = (X - mean) / np.where(std > 0, std, 1.0)
+            self._normalized = np.nan_to_num(Z, nan=0.0).astype(np.float32)
+        return self._normalized
+
+    def weight_vector(self, weights: dict[str, float]) -> np.ndarray:
+        unknown = set(weights) - set(self.features)
+        if unknown:
+            raise KeyError(f"Unknown features: {sorted(unknown)}")
+        w = np.zeros(len(self.features), dtype=np.float32)
+        for name, value in weights.items():
+            w[self.features.index(name)] = value
+        return w
+
+    def score(self, weights: dict[str, float] | np.ndarray) -> np.ndarray:
+        """Weighted score of every region and year.
+
+        *weights* is a ``{feature: weight}`` dict, a ``(features,)`` vector,
+        or a ``(features, k)`` matrix of k weightings. Returns
+        ``(regions, years)`` or ``(regions, years, k)``.
+        """
+        W = self.weight_vector(weights) if isinstance(weights, dict) else np.asarray(weights, dtype=np.float32)
+        if W.shape[0] != len(self.features):
+            raise ValueError(f"Expected {len(self.features)} weights, got {W.shape[0]}")
+        return self.normalized() @ W
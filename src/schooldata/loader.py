@@ -1,6 +1,6 @@
 """High-level data loading orchestrator.
 
-Pipeline: API/CSV → Preprocess → Parquet + manifest.
+Pipeline: API/CSV → Preprocess → Parquet + stats sidecar + manifest.
 
 Usage::
 
@@ -9,67 +9,60 @@ Usage::
     load_from_api("0", year=2026)                      # 전국 학교기본정보
     load_from_api("0", year=2026, sido_code="11")      # 서울만
     load_from_csv("0", "path/to/school_basic.csv", year=2023)
+    load_from_csv_by_year("유초중등학생현황", "data/csvs/유초중등학생현황(09-23).csv")
 """
 
 from __future__ import annotations
 
-import json
 import logging
-from datetime import datetime, timezone
 from pathlib import Path
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 
 from schooldata.api_client import SchoolInfoClient
 from schooldata.codes import API_TYPES
 from schooldata.config import DUCKDB_PATH, PROJECT_ROOT
+from schooldata.db import SCHOOL_KEY, YEAR_KEY
+from schooldata.manifest import MANIFEST_PATH, show_manifest, update_manifest  # noqa: F401 (re-exported)
 from schooldata.preprocess import preprocess
+from schooldata.stats import compute_stats, merge_stats, save_stats, write_stats
 
 logger = logging.getLogger(__name__)
 
 PARQUET_DIR = PROJECT_ROOT / "data" / "parquet"
-MANIFEST_PATH = PROJECT_ROOT / "data" / "manifest.json"
 
+# Rows per pandas chunk in the streaming multi-year CSV mode
+CSV_CHUNK_ROWS = 50_000
 
-# ── Manifest ───────────────────────────────────────────────────
-
-def _read_manifest() -> dict:
-    if MANIFEST_PATH.exists():
-        return json.loads(MANIFEST_PATH.read_text(encoding="utf-8"))
-    return {}
-
-
-def _write_manifest(manifest: dict) -> None:
-    MANIFEST_PATH.parent.mkdir(parents=True, exist_ok=True)
-    MANIFEST_PATH.write_text(
-        json.dumps(manifest, ensure_ascii=False, indent=2),
-        encoding="utf-8",
-    )
-
-
-def _update_manifest(api_type: str, year: int, source: str, row_count: int) -> None:
-    manifest = _read_manifest()
-    label = API_TYPES.get(api_type, api_type)
-    manifest.setdefault(label, {})
-    manifest[label][str(year)] = {
-        "api_type": api_type,
-        "source": source,
-        "row_count": row_count,
-        "ingested_at": datetime.now(timezone.utc).isoformat(),
-    }
-    _write_manifest(manifest)
+# EDSS columns are read as text; these are cast before writing so stats
+# sidecars and column_range() see numbers. Keys become nullable ints,
+# measures are recognized by name (…학생수, …면적, …사용량, …금액).
+_EDSS_INT_COLUMNS = (SCHOOL_KEY, YEAR_KEY)
+_EDSS_NUMERIC_SUFFIXES = ("수", "면적", "사용량", "금액")
 
 
 # ── Parquet output ─────────────────────────────────────────────
 
-def _write_parquet(api_type: str, year: int, df: pd.DataFrame) -> Path:
+def _parquet_path(api_type: str, year: int) -> Path:
     label = API_TYPES.get(api_type, api_type)
     safe_label = label.replace("/", "_").replace(" ", "_")
     out_dir = PARQUET_DIR / safe_label
     out_dir.mkdir(parents=True, exist_ok=True)
-    out_path = out_dir / f"{year}.parquet"
-    df.to_parquet(out_path, index=False, engine="pyarrow")
-    logger.info("Written %d rows → %s", len(df), out_path)
+    return out_dir / f"{year}.parquet"
+
+
+def _write_parquet(api_type: str, year: int, df: pd.DataFrame) -> Path:
+    out_path = _parquet_path(api_type, year)
+    # One Arrow conversion feeds both the Parquet writer and the stats sidecar
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    # Write-then-rename so readers never see a half-written file
+    tmp_path = out_path.with_name(out_path.name + ".tmp")
+    pq.write_table(table, tmp_path)
+    tmp_path.replace(out_path)
+    write_stats(table, out_path)
+    logger.info("Written %d rows → %s (+ stats sidecar)", len(df), out_path)
     return out_path
 
 
@@ -98,7 +91,7 @@ def load_from_api(
 
     df = preprocess(api_type, rows, year=year)
     out_path = _write_parquet(api_type, year, df)
-    _update_manifest(api_type, year, "api", len(df))
+    update_manifest(api_type, year, "api", len(df))
 
     logger.info("=== Done [%s] %s ===", api_type, label)
     return out_path
@@ -133,21 +126,192 @@ def load_from_csv(
 
     df = preprocess(api_type, df_raw, year=year)
     out_path = _write_parquet(api_type, year, df)
-    _update_manifest(api_type, year, "csv", len(df))
+    update_manifest(api_type, year, "csv", len(df))
 
     logger.info("=== Done [%s] %s ===", api_type, label)
     return out_path
 
 
-# ── Status ─────────────────────────────────────────────────────
+# ── Multi-year CSV ingestion ───────────────────────────────────
+
+def _detect_encoding(csv_path: Path, encoding: str, sample_bytes: int = 1 << 20) -> str:
+    """Check *encoding* against the head of the file; fall back to cp949."""
+    with open(csv_path, "rb") as f:
+        head = f.read(sample_bytes)
+    head = head[: head.rfind(b"\n") + 1] or head  # don't split a multibyte char
+    try:
+        head.decode(encoding)
+        return encoding
+    except UnicodeDecodeError:
+        logger.info("%s failed on file head, using cp949 encoding", encoding)
+        return "cp949"
+
+
+def _cast_edss_numeric(df: pd.DataFrame) -> pd.DataFrame:
+    """Cast the EDSS key and measure columns of a text chunk to numbers."""
+    for col in df.columns:
+        if pd.api.types.is_numeric_dtype(df[col]):
+            continue
+        base = col.removesuffix("_2014년이후")
+        if col in _EDSS_INT_COLUMNS or base.endswith(_EDSS_NUMERIC_SUFFIXES):
+            values = pd.to_numeric(df[col], errors="coerce")
+            lost = int((values.isna() & df[col].notna()).sum())
+            if lost:
+                logger.warning("Column %s: %d non-numeric values set to null", col, lost)
+            df[col] = values.astype("Int64") if col in _EDSS_INT_COLUMNS else values.astype("float64")
+    return df
+
+
+def _arrow_chunk(df: pd.DataFrame) -> pa.Table:
+    """Arrow table with a schema stable across chunks.
+
+    All-null chunks would otherwise infer ``null`` columns, and integer
+    columns turn float once a chunk contains NaN (except the nullable-int
+    keys and ``data_year``, which stay int64).
+    """
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    fields = []
+    for field in table.schema:
+        if pa.types.is_null(field.type):
+            field = field.with_type(pa.string())
+        elif pa.types.is_integer(field.type) and field.name not in ("data_year", *_EDSS_INT_COLUMNS):
+            field = field.with_type(pa.float64())
+        fields.append(field)
+    return table.cast(pa.schema(fields))
+
+
+class _YearSink:
+    """Buffered Parquet writer + running stats for one output year."""
+
+    def __init__(self, final_path: Path, flush_rows: int):
+        self.final_path = final_path
+        self.tmp_path = final_path.with_name(final_path.name + ".tmp")
+        self.flush_rows = flush_rows
+        self.schema: pa.Schema | None = None
+        self.writer: pq.ParquetWriter | None = None
+        self.buffer: list[pa.Table] = []
+        self.buffered = 0
+        self.rows = 0
+        self.stats: dict | None = None
+
+    def add(self, table: pa.Table) -> None:
+        if self.schema is None:
+            self.schema = table.schema
+        else:
+            table = table.cast(self.schema)
+        self.buffer.append(table)
+        self.buffered += table.num_rows
+        if self.buffered >= self.flush_rows:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self.buffer:
+            return
+        table = pa.concat_tables(self.buffer)
+        if self.writer is None:
+            self.writer = pq.ParquetWriter(self.tmp_path, self.schema)
+        self.writer.write_table(table)
+        chunk_stats = compute_stats(table)
+        self.stats = chunk_stats if self.stats is None else merge_stats([self.stats, chunk_stats])
+        self.rows += table.num_rows
+        self.buffer, self.buffered = [], 0
+
+    def commit(self) -> Path:
+        self.flush()
+        self.writer.close()
+        self.tmp_path.replace(self.final_path)
+        save_stats(self.stats, self.final_path)
+        return self.final_path
+
+    def abort(self) -> None:
+        if self.writer is not None:
+            self.writer.close()
+        self.tmp_path.unlink(missing_ok=True)
+
+
+def _stream_years(
+    api_type: str,
+    csv_path: Path,
+    encoding: str,
+    year_column: str,
+    chunksize: int,
+) -> dict[int, Path]:
+    sinks: dict[int, _YearSink] = {}
+    try:
+        reader = pd.read_csv(csv_path, encoding=encoding, dtype=str, chunksize=chunksize)
+        for i, chunk in enumerate(reader):
+            if year_column not in chunk.columns:
+                raise KeyError(f"Year column {year_column!r} not in {csv_path.name}")
+            years = pd.to_numeric(chunk[year_column], errors="coerce")
+            missing = int(years.isna().sum())
+            if missing:
+                logger.warning("Chunk %d: skipping %d rows without %s", i, missing, year_column)
+            for yr, part in chunk[years.notna()].groupby(years[years.notna()].astype(int)):
+                yr = int(yr)
+                df = _cast_edss_numeric(preprocess(api_type, part, year=yr))
+                if df.empty:
+                    continue
+                if yr not in sinks:
+                    sinks[yr] = _YearSink(_parquet_path(api_type, yr), chunksize)
+                sinks[yr].add(_arrow_chunk(df))
+            # Bound memory by rows buffered across all years, not per year
+            if sum(sink.buffered for sink in sinks.values()) >= chunksize:
+                for sink in sinks.values():
+                    sink.flush()
+            logger.debug("Chunk %d: %d rows routed", i, len(chunk))
+        return {yr: sink.commit() for yr, sink in sorted(sinks.items())}
+    except BaseException:
+        for sink in sinks.values():
+            sink.abort()
+        raise
+
+
+def load_from_csv_by_year(
+    api_type: str,
+    csv_path: str | Path,
+    *,
+    encoding: str = "utf-8",
+    year_column: str = "조사년도",
+    chunksize: int = CSV_CHUNK_ROWS,
+) -> dict[int, Path]:
+    """Stream a multi-year CSV once, splitting rows into per-year Parquet files.
+
+    Meant for the EDSS files (2009–2023 in one CSV): the file is parsed in
+    chunks of *chunksize* rows, each row routed by
+    *year_column* to ``{year}.parquet`` with its own stats sidecar and
+    manifest entry. Outputs are written to ``.tmp`` files and renamed only
+    after the whole file parsed, so a failed run leaves existing years intact.
+
+    Rows buffered across all years are flushed once they reach *chunksize*,
+    so peak memory is about two chunks (the one being parsed plus buffers)
+    regardless of how many years the file holds.
+
+    Deduplication in :func:`preprocess` applies within each chunk only.
+    ``학교ID``/``조사년도`` are written as int64 and count/area/amount
+    columns as float64 (see ``_EDSS_NUMERIC_SUFFIXES``); everything else
+    stays text.
+
+    Returns ``{year: parquet_path}``.
+    """
+    label = API_TYPES.get(api_type, api_type)
+    logger.info("=== CSV Ingest (by year) [%s] %s, file=%s ===", api_type, label, csv_path)
+
+    csv_path = Path(csv_path)
+    if not csv_path.exists():
+        raise FileNotFoundError(f"CSV not found: {csv_path}")
+
+    enc = _detect_encoding(csv_path, encoding)
+    try:
+        paths = _stream_years(api_type, csv_path, enc, year_column, chunksize)
+    except UnicodeDecodeError:
+        if enc == "cp949":
+            raise
+        logger.info("%s failed mid-file, restarting with cp949 encoding", enc)
+        paths = _stream_years(api_type, csv_path, "cp949", year_column, chunksize)
+
+    for yr, path in paths.items():
+        update_manifest(api_type, yr, "csv", pq.read_metadata(path).num_rows)
+        logger.info("  %d → %s", yr, path)
 
-def show_manifest() -> None:
-    """Print the current manifest."""
-    manifest = _read_manifest()
-    if not manifest:
-        print("No data loaded yet.")
-        return
-    for label, years in sorted(manifest.items()):
-        print(f"\n{label}:")
-        for yr, info in sorted(years.items()):
-            print(f"  {yr}: {info['source']}  ({info['row_count']} rows, {info['ingested_at'][:10]})")
+    logger.info("=== Done [%s] %s: %d years ===", api_type, label, len(paths))
+    return paths
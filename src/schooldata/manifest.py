@@ -0,0 +1,63 @@
+"""Ingest manifest — which dataset/year was loaded from where.
+
+Kept free of pandas/pyarrow/httpx/dotenv so that lightweight CLI commands
+(``status``) can read it without importing the ingest stack. For the same
+reason the project root is resolved here rather than taken from
+``schooldata.config``, which loads ``.env`` on import.
+
+Usage::
+
+    from schooldata.manifest import read_manifest, show_manifest
+
+    read_manifest()["학교기본정보"]["2026"]["row_count"]
+    show_manifest()
+"""
+
+from __future__ import annotations
+
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+
+from schooldata.codes import API_TYPES
+
+MANIFEST_PATH = Path(__file__).resolve().parent.parent.parent / "data" / "manifest.json"
+
+
+def read_manifest() -> dict:
+    if MANIFEST_PATH.exists():
+        return json.loads(MANIFEST_PATH.read_text(encoding="utf-8"))
+    return {}
+
+
+def write_manifest(manifest: dict) -> None:
+    MANIFEST_PATH.parent.mkdir(parents=True, exist_ok=True)
+    MANIFEST_PATH.write_text(
+        json.dumps(manifest, ensure_ascii=False, indent=2),
+        encoding="utf-8",
+    )
+
+
+def update_manifest(api_type: str, year: int, source: str, row_count: int) -> None:
+    manifest = read_manifest()
+    label = API_TYPES.get(api_type, api_type)
+    manifest.setdefault(label, {})
+    manifest[label][str(year)] = {
+        "api_type": api_type,
+        "source": source,
+        "row_count": row_count,
+        "ingested_at": datetime.now(timezone.utc).isoformat(),
+    }
+    write_manifest(manifest)
+
+
+def show_manifest() -> None:
+    """Print the current manifest."""
+    manifest = read_manifest()
+    if not manifest:
+        print("No data loaded yet.")
+        return
+    for label, years in sorted(manifest.items()):
+        print(f"\n{label}:")
+        for yr, info in sorted(years.items()):
+            print(f"  {yr}: {info['source']}  ({info['row_count']} rows, {info['ingested_at'][:10]})")
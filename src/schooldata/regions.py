@@ -0,0 +1,197 @@
+"""시도/시군구 code lookups from the compiled ``region_codes.bin`` table.
+
+The table is generated once from ``data/sido_sggCode.xlsx`` by
+``scripts/build_region_codes.py``; nothing here parses xlsx. Arrays are
+NumPy views over the file bytes (no copies), scalar lookups are dict hits,
+and the ``*_array`` functions map whole columns at once.
+
+Note: these are the codes in the 학교알리미 시도시군구코드.xlsx, whose
+시도코드 (e.g. 부산 26) differ from ``codes.SIDO_CODES`` (부산 21).
+시군구코드 always start with their own 2-digit 시도코드 here.
+
+Usage::
+
+    from schooldata.regions import sgg_code, sgg_name, sgg_codes, sgg_name_array
+
+    sgg_code("서울특별시", "중구")          # "11140"
+    sgg_name("11140")                      # ("서울특별시", "중구")
+    sgg_codes("11")                        # ["11110", "11140", ...]
+    sgg_name_array(df["sggCode"])          # ndarray of 시군구명
+"""
+
+from __future__ import annotations
+
+import struct
+from functools import lru_cache
+from importlib import resources
+
+import numpy as np
+
+TABLE_NAME = "region_codes.bin"
+_MAGIC = b"SGGC"
+_HEADER = struct.Struct("<4sIII")
+
+
+class RegionTable:
+    """In-memory view of the compiled code table."""
+
+    def __init__(self, buf: bytes):
+        magic, version, n_sido, n_sgg = _HEADER.unpack_from(buf, 0)
+        if magic != _MAGIC or version != 1:
+            raise ValueError(f"Not a v1 region code table (magic={magic!r}, version={version})")
+
+        offset = _HEADER.size
+
+        def take(dtype: str, count: int) -> np.ndarray:
+            nonlocal offset
+            arr = np.frombuffer(buf, dtype=dtype, count=count, offset=offset)
+            offset += arr.nbytes
+            return arr
+
+        self.sido_codes = take("<i4", n_sido)
+        sido_offsets = take("<u4", n_sido + 1)
+        self.sgg_codes = take("<i4", n_sgg)
+        self.sgg_sido = take("<i4", n_sgg)
+        sgg_offsets = take("<u4", n_sgg + 1)
+        blob = memoryview(buf)[offset:]
+
+        def names(offsets: np.ndarray) -> np.ndarray:
+            return np.array(
+                [str(blob[a:b], "utf-8") for a, b in zip(offsets[:-1], offsets[1:])],
+                dtype=object,
+            )
+
+        self.sido_names = names(sido_offsets)
+        self.sgg_names = names(sgg_offsets)
+        self.sgg_sido_names = self.sido_names[self.sgg_sido]
+
+        # Dense code → row index (codes are < 100000), -1 where unknown
+        self._sgg_pos = np.full(100_000, -1, dtype=np.int32)
+        self._sgg_pos[self.sgg_codes] = np.arange(n_sgg, dtype=np.int32)
+        self._sido_pos = np.full(100, -1, dtype=np.int32)
+        self._sido_pos[self.sido_codes] = np.arange(n_sido, dtype=np.int32)
+
+        self._sgg_by_name = {
+            (sido, sgg): int(code)
+            for sido, sgg, code in zip(self.sgg_sido_names, self.sgg_names, self.sgg_codes)
+        }
+        self._sido_by_name = {name: int(code) for name, code in zip(self.sido_names, self.sido_codes)}
+
+
+@lru_cache(maxsize=1)
+def table() -> RegionTable:
+    """Load the packaged code table (once per process)."""
+    return RegionTable(resources.files("schooldata").joinpath(TABLE_NAME).read_bytes())
+
+
+def _codes(values, width: int) -> np.ndarray:
+    """Array-like of str/int/float codes → int64 array, invalid → -1.
+
+    Float is what an int code column with nulls becomes in pandas; NaN
+    and non-integral values map to -1.
+    """
+    arr = np.asarray(values)
+    if arr.dtype.kind in "iu":
+        return arr.astype(np.int64)
+    if arr.dtype.kind == "f":
+        ok = np.isfinite(arr) & (arr == np.floor(arr)) & (arr >= 0) & (arr < 10**width)
+        return np.where(ok, arr, -1).astype(np.int64)
+    out = np.full(arr.shape, -1, dtype=np.int64)
+    text = arr.astype(str)
+    ok = np.char.isdigit(text) & (np.char.str_len(text) == width)
+    out[ok] = text[ok].astype(np.int64)
+    return out
+
+
+def _lookup_names(keys: np.ndarray, mapping: dict) -> np.ndarray:
+    """Map each key through a dict, looking up only the distinct keys."""
+    if keys.size == 0:
+        return np.empty(0, dtype=np.int64)
+    uniq, inverse = np.unique(keys, return_inverse=True)
+    mapped = np.array([mapping.get(u, -1) for u in uniq], dtype=np.int64)
+    return mapped[inverse.reshape(-1)]
+
+
+# ── Scalar lookups ─────────────────────────────────────────────
+
+def _scalar_code(code: str | int) -> int:
+    """int(code), or -1 when it is not a number."""
+    try:
+        return int(code)
+    except (TypeError, ValueError):
+        return -1
+
+
+def sido_code(name: str) -> str | None:
+    code = table()._sido_by_name.get(name)
+    return None if code is None else f"{code:02d}"
+
+
+def sido_name(code: str | int) -> str | None:
+    c = _scalar_code(code)
+    pos = table()._sido_pos[c] if 0 <= c < 100 else -1
+    return None if pos < 0 else table().sido_names[pos]
+
+
+def sgg_code(sido: str, sgg: str) -> str | None:
+    """5-digit 시군구코드 for (시도명, 시군구명); 시군구명 alone is ambiguous (중구)."""
+    code = table()._sgg_by_name.get((sido, sgg))
+    return None if code is None else f"{code:05d}"
+
+
+def sgg_name(code: str | int) -> tuple[str, str] | None:
+    """(시도명, 시군구명) for a 5-digit 시군구코드."""
+    t = table()
+    c = _scalar_code(code)
+    pos = t._sgg_pos[c] if 0 <= c < 100_000 else -1
+    return None if pos < 0 else (t.sgg_sido_names[pos], t.sgg_names[pos])
+
+
+def sgg_codes(sido: str | int | None = None) -> list[str]:
+    """All 시군구코드, optionally within one 시도코드 (excludes 전체 00000)."""
+    codes = table().sgg_codes
+    codes = codes[codes > 0]
+    if sido is not None:
+        codes = codes[codes // 1000 == int(sido)]
+    return [f"{c:05d}" for c in codes]
+
+
+# ── Vectorized lookups ─────────────────────────────────────────
+
+def sgg_name_array(codes) -> np.ndarray:
+    """시군구코드 column → 시군구명 array (None where unknown)."""
+    t = table()
+    c = _codes(codes, 5)
+    pos = np.where((c >= 0) & (c < 100_000), t._sgg_pos[np.clip(c, 0, 99_999)], -1)
+    return np.where(pos >= 0, t.sgg_names[pos], None)
+
+
+def sgg_sido_name_array(codes) -> np.ndarray:
+    """시군구코드 column → 시도명 array (None where unknown)."""
+    t = table()
+    c = _codes(codes, 5)
+    pos = np.where((c >= 0) & (c < 100_000), t._sgg_pos[np.clip(c, 0, 99_999)], -1)
+    return np.where(pos >= 0, t.sgg_sido_names[pos], None)
+
+
+def sgg_code_array(sido_names, sgg_names) -> np.ndarray:
+    """(시도명, 시군구명) columns → int 시군구코드 array (-1 where unknown)."""
+    keys = np.stack([np.asarray(sido_names, dtype=str), np.asarray(sgg_names, dtype=str)], axis=1)
+    if len(keys) == 0:
+        return np.empty(0, dtype=np.int64)
+    uniq, inverse = np.unique(keys, axis=0, return_inverse=True)
+    mapped = np.array([table()._sgg_by_name.get((a, b), -1) for a, b in uniq], dtype=np.int64)
+    return mapped[inverse.reshape(-1)]
+
+
+def sido_code_array(names) -> np.ndarray:
+    """시도명 column → int 시도코드 array (-1 where unknown)."""
+    return _lookup_names(np.asarray(names, dtype=str), table()._sido_by_name)
+
+
+def sido_name_array(codes) -> np.ndarray:
+    """시도코드 column → 시도명 array (None where unknown)."""
+    t = table()
+    c = _codes(codes, 2)
+    pos = np.where((c >= 0) & (c < 100), t._sido_pos[np.clip(c, 0, 99)], -1)
+    return np.where(pos >= 0, t.sido_names[pos], None)
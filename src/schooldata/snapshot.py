@@ -0,0 +1,226 @@
+"""Versioned read-only DuckDB snapshots for dashboard workers.
+
+``publish_snapshot()`` materializes every Parquet dataset, the EDSS
+school-history tables (clustered by 학교ID, in the ``history`` schema so they
+never shadow a same-named dataset) and the merged column statistics into
+one immutable DuckDB file, then switches the ``CURRENT`` pointer to it with
+an atomic rename. Workers open the pointed-to file read-only, so they never
+see a half-written ``{year}.parquet`` and pick up new versions without
+downtime.
+
+Layout::
+
+    data/snapshots/
+    ├── CURRENT                              # "school-20260301T120000Z.duckdb"
+    ├── school-20260301T120000Z.duckdb
+    └── school-20260215T090000Z.duckdb
+
+Usage::
+
+    from schooldata.db import school_history
+    from schooldata.snapshot import publish_snapshot, SnapshotReader
+
+    publish_snapshot()                      # after a successful ingest
+
+    reader = SnapshotReader()               # in each worker
+    reader.sql('SELECT COUNT(*) FROM "학교기본정보"').fetchone()
+    school_history(7010057, reader.connection)   # history."<EDSS table>"
+    reader.refresh()                        # cheap; swaps if a new version exists
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+
+import duckdb
+
+from schooldata.config import PROJECT_ROOT
+from schooldata.db import PARQUET_DIR, RAW_PARQUET_DIR, build_school_history, dataset_stats
+from schooldata.manifest import read_manifest
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_DIR = PROJECT_ROOT / "data" / "snapshots"
+POINTER_NAME = "CURRENT"
+
+# Columns indexed in the materialized datasets when present
+_INDEX_COLUMNS = ("SCHUL_CODE",)
+
+
+# ── Pointer ────────────────────────────────────────────────────
+
+def _pointer_path(snapshot_dir: Path) -> Path:
+    return snapshot_dir / POINTER_NAME
+
+
+def current_snapshot(snapshot_dir: str | Path = SNAPSHOT_DIR) -> Path | None:
+    """Path of the snapshot the pointer refers to, or None if never published."""
+    pointer = _pointer_path(Path(snapshot_dir))
+    if not pointer.exists():
+        return None
+    return Path(snapshot_dir) / pointer.read_text(encoding="utf-8").strip()
+
+
+def _switch_pointer(snapshot_dir: Path, name: str) -> None:
+    tmp = snapshot_dir / f".{POINTER_NAME}.tmp"
+    tmp.write_text(name, encoding="utf-8")
+    os.replace(tmp, _pointer_path(snapshot_dir))  # atomic on POSIX and Windows
+
+
+# ── Publish ────────────────────────────────────────────────────
+
+def _store_stats(con: duckdb.DuckDBPyConnection, dataset: str, *, raw: bool, **dirs) -> None:
+    """Copy a dataset's merged stats sidecars into the ``_stats`` table."""
+    try:
+        stats = dataset_stats(dataset, raw=raw, **dirs)
+    except (FileNotFoundError, ValueError) as e:
+        logger.warning("Snapshot has no stats for %s: %s", dataset, e)
+        return
+    con.execute(
+        "INSERT INTO _stats VALUES (?, ?, ?)",
+        [dataset, raw, json.dumps(stats, ensure_ascii=False)],
+    )
+
+
+def _materialize_datasets(con: duckdb.DuckDBPyConnection, parquet_dir: Path) -> list[str]:
+    datasets = []
+    if not parquet_dir.exists():
+        return datasets
+    for ds_dir in sorted(parquet_dir.iterdir()):
+        if not ds_dir.is_dir() or not any(ds_dir.glob("*.parquet")):
+            continue
+        table = ds_dir.name
+        con.execute(f"""
+            CREATE TABLE "{table}" AS
+            SELECT * FROM read_parquet('{ds_dir / "*.parquet"}', union_by_name=true)
+        """)
+        cols = {r[0] for r in con.sql(f'DESCRIBE "{table}"').fetchall()}
+        for col in _INDEX_COLUMNS:
+            if col in cols:
+                con.execute(f'CREATE INDEX "idx_{table}_{col}" ON "{table}" ("{col}")')
+        _store_stats(con, table, raw=False, parquet_dir=parquet_dir)
+        datasets.append(table)
+        logger.info("Snapshot dataset %s materialized", table)
+    return datasets
+
+
+def _prune(snapshot_dir: Path, keep: int) -> None:
+    versions = sorted(snapshot_dir.glob("school-*.duckdb"), reverse=True)
+    current = current_snapshot(snapshot_dir)
+    for old in versions[keep:]:
+        if old == current:
+            continue
+        # Workers still holding an old file keep reading it until refresh
+        # (POSIX keeps unlinked open files alive).
+        old.unlink(missing_ok=True)
+        logger.info("Pruned snapshot %s", old.name)
+
+
+def publish_snapshot(
+    snapshot_dir: str | Path = SNAPSHOT_DIR,
+    *,
+    parquet_dir: str | Path = PARQUET_DIR,
+    raw_dir: str | Path = RAW_PARQUET_DIR,
+    keep: int = 3,
+) -> Path:
+    """Build a new immutable snapshot and atomically make it current.
+
+    The file is written under a temporary name and only renamed into place
+    and pointed to once complete, so readers never see a partial snapshot.
+    Keeps the newest *keep* versions.
+
+    Returns the published snapshot path.
+    """
+    snapshot_dir = Path(snapshot_dir)
+    snapshot_dir.mkdir(parents=True, exist_ok=True)
+    version = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%fZ")
+    final = snapshot_dir / f"school-{version}.duckdb"
+    tmp = snapshot_dir / f".school-{version}.duckdb.tmp"
+
+    try:
+        with duckdb.connect(str(tmp)) as con:
+            con.execute("CREATE TABLE _stats (dataset VARCHAR, raw BOOLEAN, stats JSON, PRIMARY KEY (dataset, raw))")
+            con.execute("CREATE TABLE _snapshot_meta (key VARCHAR PRIMARY KEY, value JSON)")
+            datasets = _materialize_datasets(con, Path(parquet_dir))
+            con.executemany("INSERT INTO _snapshot_meta VALUES (?, ?)", [
+                ["version", json.dumps(version)],
+                ["datasets", json.dumps(datasets, ensure_ascii=False)],
+                ["manifest", json.dumps(read_manifest(), ensure_ascii=False)],
+            ])
+            con.execute("CHECKPOINT")
+        history = build_school_history(tmp, raw_dir)
+        with duckdb.connect(str(tmp)) as con:
+            for table in history:
+                _store_stats(con, table, raw=True, raw_dir=raw_dir)
+            con.execute("CHECKPOINT")
+        tmp.replace(final)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+    _switch_pointer(snapshot_dir, final.name)
+    logger.info("Published snapshot %s (%d datasets)", final.name, len(datasets))
+    _prune(snapshot_dir, keep)
+    return final
+
+
+# ── Read side ──────────────────────────────────────────────────
+
+class SnapshotReader:
+    """Read-only connection to the current snapshot with hot reload.
+
+    Call :meth:`refresh` between requests (it only stats the pointer file);
+    when a newer snapshot is published the reader reconnects to it. The
+    previous connection is dropped, not closed, so queries already running
+    on it finish against the old version.
+    """
+
+    def __init__(self, snapshot_dir: str | Path = SNAPSHOT_DIR):
+        self.snapshot_dir = Path(snapshot_dir)
+        self.path: Path | None = None
+        self._con: duckdb.DuckDBPyConnection | None = None
+        self._pointer_mtime: int | None = None
+        self.refresh()
+        if self._con is None:
+            raise FileNotFoundError(f"No snapshot published in {self.snapshot_dir}")
+
+    def refresh(self) -> bool:
+        """Switch to the current snapshot if it changed. Returns True on swap."""
+        try:
+            mtime = _pointer_path(self.snapshot_dir).stat().st_mtime_ns
+        except FileNotFoundError:
+            return False
+        if mtime == self._pointer_mtime:
+            return False
+        path = current_snapshot(self.snapshot_dir)
+        self._pointer_mtime = mtime
+        if path is None or path == self.path:
+            return False
+        self._con = duckdb.connect(str(path), read_only=True)
+        self.path = path
+        logger.info("Snapshot reader switched to %s", path.name)
+        return True
+
+    @property
+    def connection(self) -> duckdb.DuckDBPyConnection:
+        return self._con
+
+    def sql(self, sql: str) -> duckdb.DuckDBPyRelation:
+        """Run SQL against the snapshot; datasets are tables named by label."""
+        return self._con.sql(sql)
+
+    def stats(self, dataset: str, *, raw: bool = False) -> dict | None:
+        """Merged column statistics stored in the snapshot; ``raw=True`` for
+        the EDSS files behind the ``history`` tables."""
+        row = self._con.execute(
+            "SELECT stats FROM _stats WHERE dataset = ? AND raw = ?", [dataset, raw]
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def version(self) -> str:
+        row = self._con.sql("SELECT value FROM _snapshot_meta WHERE key = 'version'").fetchone()
+        return json.loads(row[0])
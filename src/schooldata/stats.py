@@ -0,0 +1,233 @@
+"""Column statistics sidecars written next to each Parquet file.
+
+Computed from the in-memory Arrow table in the same pass that writes the
+Parquet file, so dashboards can answer "which 시도명 exist?" or "what is
+the range of 학생수?" without scanning data. Each ``X.parquet`` gets an
+``X.stats.json`` holding per column:
+
+- ``null_count``, ``min``, ``max``
+- ``distinct``: the exact value set, if it has at most ``LOW_CARDINALITY`` values
+- ``hll``: a HyperLogLog sketch (base64 registers) otherwise
+
+Sidecars merge losslessly for counts/ranges/sets and approximately for
+HLL, see :func:`merge_stats`.
+
+Usage::
+
+    from schooldata.stats import compute_stats, write_stats, merge_stats
+
+    write_stats(table, "data/parquet/학교기본정보/2026.parquet")
+    merged = merge_stats([read_stats(p) for p in paths])
+    merged["columns"]["LCTN_SC_NM"]["distinct"]
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import json
+import math
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+
+LOW_CARDINALITY = 256
+HLL_PRECISION = 12  # 4096 registers, ~1.6% standard error
+
+_U64 = np.uint64
+
+
+# ── HyperLogLog ────────────────────────────────────────────────
+
+class HyperLogLog:
+    """Mergeable distinct-count sketch over 64-bit hashes."""
+
+    def __init__(self, p: int = HLL_PRECISION, registers: np.ndarray | None = None):
+        self.p = p
+        self.m = 1 << p
+        self.registers = registers if registers is not None else np.zeros(self.m, dtype=np.uint8)
+
+    def add_hashes(self, hashes: np.ndarray) -> None:
+        if len(hashes) == 0:
+            return
+        hashes = hashes.astype(_U64, copy=False)
+        idx = (hashes >> _U64(64 - self.p)).astype(np.int64)
+        rest = hashes & _U64((1 << (64 - self.p)) - 1)
+        # rank = position of the leftmost 1-bit in the remaining 64-p bits
+        powers = np.left_shift(_U64(1), np.arange(64 - self.p, dtype=_U64))
+        bit_length = np.searchsorted(powers, rest, side="right")
+        rank = (64 - self.p - bit_length + 1).astype(np.uint8)
+        np.maximum.at(self.registers, idx, rank)
+
+    def merge(self, other: HyperLogLog) -> None:
+        if other.p != self.p:
+            raise ValueError(f"Cannot merge HLL p={other.p} into p={self.p}")
+        np.maximum(self.registers, other.registers, out=self.registers)
+
+    def estimate(self) -> int:
+        m = self.m
+        alpha = 0.7213 / (1 + 1.079 / m)
+        raw = alpha * m * m / float(np.sum(np.ldexp(1.0, -self.registers.astype(np.int64))))
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if raw <= 2.5 * m and zeros:
+            return round(m * math.log(m / zeros))
+        return round(raw)
+
+    def to_json(self) -> str:
+        return base64.b64encode(self.registers.tobytes()).decode("ascii")
+
+    @classmethod
+    def from_json(cls, data: str, p: int = HLL_PRECISION) -> HyperLogLog:
+        regs = np.frombuffer(base64.b64decode(data), dtype=np.uint8).copy()
+        return cls(p, regs)
+
+
+def _splitmix64(x: np.ndarray) -> np.ndarray:
+    x = x.astype(_U64, copy=True)
+    with np.errstate(over="ignore"):
+        x += _U64(0x9E3779B97F4A7C15)
+        x = (x ^ (x >> _U64(30))) * _U64(0xBF58476D1CE4E5B9)
+        x = (x ^ (x >> _U64(27))) * _U64(0x94D049BB133111EB)
+    return x ^ (x >> _U64(31))
+
+
+def _hash_values(values: pa.Array) -> np.ndarray:
+    """Stable 64-bit hashes, consistent across files for the same value."""
+    t = values.type
+    if pa.types.is_integer(t) or pa.types.is_floating(t) or pa.types.is_boolean(t):
+        # Normalize all numerics to float64 bits so int/float schema drift
+        # between years still hashes 1 == 1.0 identically.
+        bits = values.cast(pa.float64()).to_numpy(zero_copy_only=False).view(_U64)
+        return _splitmix64(bits)
+    return np.fromiter(
+        (
+            int.from_bytes(hashlib.blake2b(str(v).encode("utf-8"), digest_size=8).digest(), "little")
+            for v in values.to_pylist()
+        ),
+        dtype=_U64,
+        count=len(values),
+    )
+
+
+# ── Compute / read / write ─────────────────────────────────────
+
+def _scalar(value: pa.Scalar) -> Any:
+    v = value.as_py()
+    if v is None or isinstance(v, (bool, int, float, str)):
+        return v
+    return str(v)
+
+
+def _column_stats(col: pa.ChunkedArray) -> dict[str, Any]:
+    out: dict[str, Any] = {"type": str(col.type), "null_count": col.null_count}
+    if pa.types.is_nested(col.type) or pa.types.is_null(col.type):
+        return out
+
+    mm = pc.min_max(col)
+    out["min"] = _scalar(mm["min"])
+    out["max"] = _scalar(mm["max"])
+
+    uniq = pc.drop_null(pc.unique(col))
+    if len(uniq) <= LOW_CARDINALITY:
+        out["distinct"] = sorted((_scalar(v) for v in uniq), key=str)
+    else:
+        # HLL is duplicate-insensitive, so sketching the unique set equals
+        # sketching every row — and hashes far fewer values.
+        hll = HyperLogLog()
+        hll.add_hashes(_hash_values(uniq))
+        out["hll"] = hll.to_json()
+    return out
+
+
+def compute_stats(table: pa.Table) -> dict[str, Any]:
+    """Compute the sidecar payload for an Arrow table."""
+    return {
+        "row_count": table.num_rows,
+        "hll_precision": HLL_PRECISION,
+        "columns": {name: _column_stats(table.column(name)) for name in table.column_names},
+    }
+
+
+def stats_path(parquet_path: str | Path) -> Path:
+    """``data/x/2026.parquet`` → ``data/x/2026.stats.json``."""
+    p = Path(parquet_path)
+    return p.with_name(p.stem + ".stats.json")
+
+
+def save_stats(stats: dict[str, Any], parquet_path: str | Path) -> Path:
+    """Write an already computed (or merged) sidecar payload."""
+    out = stats_path(parquet_path)
+    out.write_text(json.dumps(stats, ensure_ascii=False), encoding="utf-8")
+    return out
+
+
+def write_stats(table: pa.Table, parquet_path: str | Path) -> Path:
+    return save_stats(compute_stats(table), parquet_path)
+
+
+def read_stats(path: str | Path) -> dict[str, Any]:
+    """Read a sidecar, given either the sidecar or its Parquet path."""
+    p = Path(path)
+    if p.suffix == ".parquet":
+        p = stats_path(p)
+    return json.loads(p.read_text(encoding="utf-8"))
+
+
+# ── Merge ──────────────────────────────────────────────────────
+
+def _merge_bound(a: Any, b: Any, pick) -> Any:
+    if a is None:
+        return b
+    if b is None:
+        return a
+    try:
+        return pick(a, b)
+    except TypeError:  # mixed types across files — compare as text
+        return pick(a, b, key=str)
+
+
+def _merge_column(acc: dict[str, Any], col: dict[str, Any], p: int) -> dict[str, Any]:
+    merged = {
+        "type": "|".join(dict.fromkeys(acc["type"].split("|") + col["type"].split("|"))),
+        "null_count": acc["null_count"] + col["null_count"],
+        "min": _merge_bound(acc.get("min"), col.get("min"), min),
+        "max": _merge_bound(acc.get("max"), col.get("max"), max),
+    }
+    if "distinct" in acc and "distinct" in col:
+        values = set(acc["distinct"]) | set(col["distinct"])
+        if len(values) <= LOW_CARDINALITY:
+            merged["distinct"] = sorted(values, key=str)
+            return merged
+
+    hll = HyperLogLog(p)
+    for side in (acc, col):
+        if "hll" in side:
+            hll.merge(HyperLogLog.from_json(side["hll"], p))
+        elif "distinct" in side:
+            hll.add_hashes(_hash_values(pa.array(side["distinct"])))
+    merged["hll"] = hll.to_json()
+    return merged
+
+
+def merge_stats(sidecars: list[dict[str, Any]]) -> dict[str, Any]:
+    """Combine sidecars of several files into one.
+
+    Adds ``approx_distinct`` to every column (exact when ``distinct`` is kept).
+    """
+    p = sidecars[0]["hll_precision"] if sidecars else HLL_PRECISION
+    result: dict[str, Any] = {"row_count": 0, "hll_precision": p, "columns": {}}
+    for sc in sidecars:
+        result["row_count"] += sc["row_count"]
+        for name, col in sc["columns"].items():
+            acc = result["columns"].get(name)
+            result["columns"][name] = dict(col) if acc is None else _merge_column(acc, col, p)
+
+    for col in result["columns"].values():
+        if "distinct" in col:
+            col["approx_distinct"] = len(col["distinct"])
+        elif "hll" in col:
+            col["approx_distinct"] = HyperLogLog.from_json(col["hll"], p).estimate()
+    return result
@@ -0,0 +1,33 @@
+"""Tests for SchoolInfoClient.fetch_all_sgg 시도코드 handling (no network)."""
+
+import pytest
+
+from schooldata.api_client import SchoolInfoClient
+from schooldata.codes import SIDO_CODES
+
+
+@pytest.fixture
+def client(monkeypatch):
+    c = SchoolInfoClient(api_key="test")
+    calls = []
+    monkeypatch.setattr(c, "fetch", lambda api_type, **kw: calls.append(kw) or [kw])
+    c.calls = calls
+    return c
+
+
+def test_fetch_all_sgg_sends_sido_codes_form(client):
+    rows = client.fetch_all_sgg("0", sido_code="21", delay=0)  # 부산 in SIDO_CODES
+    assert rows
+    assert {kw["sido_code"] for kw in client.calls} == {"21"}
+    assert all(kw["sgg_code"].startswith("26") for kw in client.calls)  # 부산 in the xlsx table
+
+
+def test_fetch_all_sgg_all_regions_use_sido_codes(client):
+    client.fetch_all_sgg("0", delay=0)
+    assert {kw["sido_code"] for kw in client.calls} == set(SIDO_CODES)
+
+
+def test_fetch_all_sgg_unknown_sido(client):
+    with pytest.raises(ValueError, match="Unknown 시도코드"):
+        client.fetch_all_sgg("0", sido_code="99", delay=0)
+    assert client.calls == []
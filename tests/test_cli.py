@@ -0,0 +1,30 @@
+"""CLI startup guard: lightweight subcommands must not load the ingest stack."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+SRC_DIR = Path(__file__).parent.parent / "src"
+
+HEAVY_MODULES = ("pandas", "pyarrow", "httpx", "dotenv", "duckdb", "numpy", "polars")
+
+PROBE = """
+import sys
+from schooldata.cli import main
+main([{command!r}])
+print("HEAVY:" + ",".join(m for m in {heavy!r} if m in sys.modules))
+"""
+
+
+@pytest.mark.parametrize("command", ["list", "status"])
+def test_light_commands_skip_heavy_imports(command):
+    out = subprocess.run(
+        [sys.executable, "-c", PROBE.format(command=command, heavy=HEAVY_MODULES)],
+        capture_output=True, text=True, check=True,
+        env={**os.environ, "PYTHONPATH": str(SRC_DIR)},
+    ).stdout
+    line = next(l for l in out.splitlines() if l.startswith("HEAVY:"))
+    assert line == "HEAVY:"
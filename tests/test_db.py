@@ -0,0 +1,109 @@
+"""Tests for schooldata.db against small synthetic Parquet files."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from schooldata import db
+
+
+def test_raw_dataset_files_match_exact_table_name(tmp_path, monkeypatch):
+    monkeypatch.setattr(db, "RAW_PARQUET_DIR", tmp_path)
+    for name in ("0001. 공통_학교속성(09-23)(100%).parquet", "0002. 유초중등학교개황(09-23)(100%).parquet"):
+        (tmp_path / name).touch()
+
+    assert [f.name for f in db.dataset_files("유초중등학교개황", raw=True)] == [
+        "0002. 유초중등학교개황(09-23)(100%).parquet"
+    ]
+    assert db.dataset_files("학교", raw=True) == []
+
+
+def test_raw_dataset_files_ambiguous(tmp_path, monkeypatch):
+    monkeypatch.setattr(db, "RAW_PARQUET_DIR", tmp_path)
+    (tmp_path / "0002. 유초중등학교개황(09-23).parquet").touch()
+    (tmp_path / "유초중등학교개황(2024).parquet").touch()
+
+    with pytest.raises(ValueError, match="Ambiguous"):
+        db.dataset_files("유초중등학교개황", raw=True)
+
+
+def _synthetic_dataset(parquet_dir, rows_per_year=2000):
+    rng = np.random.default_rng(0)
+    regions = ["서울특별시", "부산광역시", "경기도"]
+    kinds = ["초등학교", "중학교"]
+    for year in (2021, 2022, 2023):
+        n = rows_per_year
+        df = pd.DataFrame({
+            "data_year": year,
+            "LCTN_SC_NM": rng.choice(regions, n),
+            "SCHUL_KND_SC_NM": rng.choice(kinds, n),
+            "SCHUL_CODE": [f"S{i:05d}" for i in range(n)],
+            "STUDENTS": rng.gamma(4.0, 100.0, n) + (year - 2021) * 50,
+        })
+        out = parquet_dir / "학교현황" / f"{year}.parquet"
+        out.parent.mkdir(parents=True, exist_ok=True)
+        df.to_parquet(out, index=False)
+
+
+@pytest.fixture
+def sampled(tmp_path, monkeypatch):
+    monkeypatch.setattr(db, "PARQUET_DIR", tmp_path / "parquet")
+    _synthetic_dataset(tmp_path / "parquet")
+    sample_db = tmp_path / "samples.duckdb"
+    db.build_sample("학교현황", fraction=0.2, db_path=sample_db)
+    return sample_db
+
+
+@pytest.mark.parametrize("agg", ["mean", "sum", "count"])
+def test_approx_aggregate_covers_exact(sampled, agg):
+    est, exact = db.approx_aggregate(
+        "학교현황", "STUDENTS", agg=agg, by=["data_year"], db_path=sampled,
+    )
+    merged = est.merge(exact.result(), on="data_year")
+    assert len(merged) == 3
+    assert (merged["sample_rows"] < 2000).all()
+    assert ((merged["ci_low"] <= merged["exact"]) & (merged["exact"] <= merged["ci_high"])).all()
+
+
+def test_approx_aggregate_domain_filter(sampled):
+    est, exact = db.approx_aggregate(
+        "학교현황", "STUDENTS", agg="sum", where="LCTN_SC_NM = '경기도'", db_path=sampled,
+    )
+    truth = exact.result()["exact"].iloc[0]
+    assert est["ci_low"].iloc[0] <= truth <= est["ci_high"].iloc[0]
+
+
+def test_approx_aggregate_empty_domain(sampled):
+    est, exact = db.approx_aggregate("학교현황", "STUDENTS", where="1=0", db_path=sampled)
+    assert est.empty
+    assert "estimate" in est.columns
+    exact.result()
+
+
+def test_approx_aggregate_requires_built_sample(tmp_path, monkeypatch):
+    monkeypatch.setattr(db, "PARQUET_DIR", tmp_path / "parquet")
+    _synthetic_dataset(tmp_path / "parquet", rows_per_year=50)
+    with pytest.raises(FileNotFoundError, match="build_sample"):
+        db.approx_aggregate("학교현황", "STUDENTS", db_path=tmp_path / "none.duckdb")
+
+
+def test_raw_and_processed_samples_do_not_collide(tmp_path, monkeypatch):
+    monkeypatch.setattr(db, "PARQUET_DIR", tmp_path / "parquet")
+    monkeypatch.setattr(db, "RAW_PARQUET_DIR", tmp_path / "raw")
+    for path, n, v in [
+        (tmp_path / "raw" / "0004. 유초중등학생현황(09-23)(100%).parquet", 50, 1),
+        (tmp_path / "parquet" / "유초중등학생현황" / "2009.parquet", 30, 100),
+    ]:
+        path.parent.mkdir(parents=True)
+        pd.DataFrame({"조사년도": 2009, "학교ID": range(n), "v": v}).to_parquet(path, index=False)
+    sample_db = tmp_path / "samples.duckdb"
+
+    built = db.build_all_samples(sample_db)
+    assert len(set(built)) == 2
+
+    for raw, truth in [(True, 50), (False, 3000)]:
+        est, exact = db.approx_aggregate(
+            "유초중등학생현황", "v", agg="sum", raw=raw, db_path=sample_db,
+        )
+        assert exact.result()["exact"].iloc[0] == truth
+        assert est["estimate"].iloc[0] == pytest.approx(truth)
@@ -0,0 +1,73 @@
+"""Tests for schooldata.features KPI rates on synthetic Parquet files."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from schooldata import db
+from schooldata.features import FeatureStore
+
+
+def _write(path, df):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    df.to_parquet(path, index=False)
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    monkeypatch.setattr(db, "PARQUET_DIR", tmp_path / "parquet")
+    monkeypatch.setattr(db, "RAW_PARQUET_DIR", tmp_path / "raw")
+    entrants = {2022: (60, 40), 2023: (45, 30)}
+    for year, (seoul, busan) in entrants.items():
+        _write(tmp_path / "parquet" / "입학생_현황" / f"{year}.parquet", pd.DataFrame({
+            "data_year": year,
+            "LCTN_SC_NM": ["서울특별시", "서울특별시", "부산광역시", "서울특별시"],
+            "SCHUL_KND_SC_NM": ["초등학교", "초등학교", "초등학교", "중학교"],
+            "BEAGE_BOY_FGR": [seoul, seoul, busan, 500 * (year - 2020)],
+            "BEAGE_GIR_FGR": [0, 0, 0, 0],
+        }))
+        _write(tmp_path / "parquet" / "방과후학교_운영현황" / f"{year}.parquet", pd.DataFrame({
+            "data_year": year,
+            "LCTN_SC_NM": ["서울특별시", "부산광역시"],
+            "ASL_PTPT_STDNT_FGR": [300, 100],
+        }))
+        _write(tmp_path / "parquet" / "교사(校舍)_현황" / f"{year}.parquet", pd.DataFrame({
+            "data_year": year,
+            "LCTN_SC_NM": ["서울특별시", "부산광역시"],
+            "COM_CCCLA_FGR": [10, 2],
+            "MMA_CCCLA_FGR": [10, 2],
+        }))
+    _write(tmp_path / "raw" / "0002. 유초중등학교개황(22-23).parquet", pd.DataFrame({
+        "조사년도": [2022, 2022, 2023, 2023],
+        "시도명": ["서울특별시", "부산광역시"] * 2,
+        "유초중등학교개황_학생수": [1000, 400, 1000, 400],
+        "유초중등학교개황_교원수": [50, 40, 50, 40],
+        "유초중등학교개황_학급수": [40, 8, 40, 8],
+    }))
+    s = FeatureStore(tmp_path / "features")
+    s.update()
+    return s
+
+
+def test_kpi_rates(store):
+    seoul = store.frame(2023).loc["서울특별시"]
+    assert seoul["kpi_a_entrant_decline_rate"] == pytest.approx(25.0)   # 120 → 90, 초등 only
+    assert seoul["kpi_b_students_per_teacher"] == pytest.approx(20.0)
+    assert seoul["kpi_c_afterschool_gap_rate"] == pytest.approx(70.0)   # (1000 - 300) / 1000
+    assert seoul["kpi_h_digital_rooms_per_class"] == pytest.approx(0.5)  # 20 / 40
+    # No previous year to compare against
+    assert np.isnan(store.frame(2022).loc["서울특별시", "kpi_a_entrant_decline_rate"])
+
+
+def test_update_is_incremental(store):
+    assert store.update() == []
+
+
+def test_rate_without_denominator_years_warns(store, tmp_path, caplog):
+    _write(tmp_path / "parquet" / "방과후학교_운영현황" / "2026.parquet", pd.DataFrame({
+        "data_year": [2026], "LCTN_SC_NM": ["서울특별시"], "ASL_PTPT_STDNT_FGR": [300],
+    }))
+    with caplog.at_level("WARNING", logger="schooldata.features"):
+        assert store.update() == ["kpi_c_afterschool_gap_rate"]
+    assert "no denominator for years [2026]" in caplog.text
+    assert 2026 not in store.years
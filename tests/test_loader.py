@@ -0,0 +1,117 @@
+"""Tests for the streaming multi-year CSV ingest (load_from_csv_by_year)."""
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from schooldata import loader, manifest
+from schooldata.stats import read_stats
+
+DATASET = "유초중등학생현황"
+HEADER = "조사년도,학교ID,시도명,학생수\n"
+
+
+def _rows(n):
+    """Rows interleaving three years, so every chunk feeds several sinks."""
+    return [(2021 + i % 3, 1000 + i, "서울특별시" if i % 2 else "부산광역시", 10 + i) for i in range(n)]
+
+
+def _write_csv(path, rows, encoding="utf-8"):
+    text = HEADER + "".join(f"{y},{sid},{region},{n}\n" for y, sid, region, n in rows)
+    path.write_bytes(text.encode(encoding))
+    return path
+
+
+@pytest.fixture
+def out_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(loader, "PARQUET_DIR", tmp_path / "parquet")
+    monkeypatch.setattr(manifest, "MANIFEST_PATH", tmp_path / "manifest.json")
+    return tmp_path / "parquet" / DATASET
+
+
+def test_routes_chunks_by_year(tmp_path, out_dir):
+    rows = _rows(20)
+    csv = _write_csv(tmp_path / "in.csv", rows)
+
+    paths = loader.load_from_csv_by_year(DATASET, csv, chunksize=4)
+
+    assert sorted(paths) == [2021, 2022, 2023]
+    for year, path in paths.items():
+        df = pd.read_parquet(path)
+        expected = sorted(sid for y, sid, _, _ in rows if y == year)
+        assert sorted(df["학교ID"]) == expected
+        assert (df["data_year"] == year).all()
+    assert not list(out_dir.glob("*.tmp"))
+
+
+def test_manifest_row_counts(tmp_path, out_dir):
+    rows = _rows(20)
+    loader.load_from_csv_by_year(DATASET, _write_csv(tmp_path / "in.csv", rows), chunksize=4)
+
+    entries = manifest.read_manifest()[DATASET]
+    assert {int(y): e["row_count"] for y, e in entries.items()} == {2021: 7, 2022: 7, 2023: 6}
+    assert {e["source"] for e in entries.values()} == {"csv"}
+
+
+def test_numeric_edss_columns(tmp_path, out_dir):
+    paths = loader.load_from_csv_by_year(DATASET, _write_csv(tmp_path / "in.csv", _rows(20)), chunksize=4)
+
+    schema = pq.read_schema(paths[2021])
+    assert schema.field("학교ID").type == pa.int64()
+    assert schema.field("조사년도").type == pa.int64()
+    assert schema.field("학생수").type == pa.float64()
+    assert schema.field("시도명").type in (pa.string(), pa.large_string())
+    col = read_stats(paths[2021])["columns"]["학교ID"]
+    assert (col["min"], col["max"]) == (1000, 1018)
+
+
+def test_restarts_with_cp949_mid_file(tmp_path, out_dir, monkeypatch):
+    # Pretend the head check passed, so the decode error surfaces mid-stream
+    monkeypatch.setattr(loader, "_detect_encoding", lambda path, encoding: encoding)
+    csv = _write_csv(tmp_path / "in.csv", _rows(20), encoding="cp949")
+
+    paths = loader.load_from_csv_by_year(DATASET, csv, chunksize=4)
+
+    df = pd.concat(pd.read_parquet(p) for p in paths.values())
+    assert len(df) == 20
+    assert set(df["시도명"]) == {"서울특별시", "부산광역시"}
+
+
+def test_failed_run_keeps_existing_years(tmp_path, out_dir, monkeypatch):
+    out_dir.mkdir(parents=True)
+    existing = out_dir / "2021.parquet"
+    pd.DataFrame({"old": [1, 2, 3]}).to_parquet(existing)
+    before = existing.read_bytes()
+
+    # Fail in the last chunk, after every year's sink has flushed to .tmp
+    preprocess, calls = loader.preprocess, []
+
+    def failing_preprocess(*args, **kwargs):
+        calls.append(1)
+        if len(calls) > 9:
+            raise RuntimeError("boom")
+        return preprocess(*args, **kwargs)
+
+    monkeypatch.setattr(loader, "preprocess", failing_preprocess)
+
+    with pytest.raises(RuntimeError, match="boom"):
+        loader.load_from_csv_by_year(DATASET, _write_csv(tmp_path / "in.csv", _rows(16)), chunksize=4)
+
+    assert existing.read_bytes() == before
+    assert sorted(p.name for p in out_dir.iterdir()) == ["2021.parquet"]
+    assert not manifest.MANIFEST_PATH.exists()
+
+
+def test_sink_abort_leaves_final_file(tmp_path):
+    final = tmp_path / "2021.parquet"
+    pd.DataFrame({"old": [1]}).to_parquet(final)
+    before = final.read_bytes()
+
+    sink = loader._YearSink(final, flush_rows=1)
+    sink.add(pa.table({"x": [1, 2]}))
+    assert sink.tmp_path.exists()
+    sink.abort()
+
+    assert not sink.tmp_path.exists()
+    assert final.read_bytes() == before
@@ -0,0 +1,33 @@
+"""Tests for schooldata.regions lookups over the packaged code table."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from schooldata import regions
+
+
+def test_scalar_lookups():
+    assert regions.sgg_code("서울특별시", "중구") == "11140"
+    assert regions.sgg_name("11140") == ("서울특별시", "중구")
+    assert regions.sido_name("26") == "부산광역시"
+    assert all(c.startswith("26") for c in regions.sgg_codes("26"))
+
+
+@pytest.mark.parametrize("code", ["abc", "", None, "99999", -1])
+def test_unknown_scalar_codes(code):
+    assert regions.sgg_name(code) is None
+    assert regions.sido_name(code) is None
+
+
+def test_float_code_column_with_nulls():
+    codes = pd.Series([11140, None])  # pandas turns this into float64 + NaN
+    assert codes.dtype.kind == "f"
+    assert list(regions.sgg_name_array(codes)) == ["중구", None]
+    assert list(regions.sgg_sido_name_array(codes)) == ["서울특별시", None]
+    assert list(regions.sido_name_array(pd.Series([26, np.nan]))) == ["부산광역시", None]
+    assert list(regions.sgg_name_array(np.array([11140.5, np.inf]))) == [None, None]
+
+
+def test_string_code_column():
+    assert list(regions.sgg_name_array(["11140", "abc", "1114"])) == ["중구", None, None]
@@ -0,0 +1,50 @@
+"""Tests for schooldata.snapshot publishing."""
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from schooldata import db, snapshot
+from schooldata.stats import write_stats
+
+
+def _write(path, n):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    table = pa.table({
+        "조사년도": [2009 + i % 3 for i in range(n)],
+        "학교ID": list(range(n)),
+    })
+    pq.write_table(table, path)
+    write_stats(table, path)
+
+
+def test_history_tables_do_not_replace_same_named_dataset(tmp_path, monkeypatch):
+    parquet_dir = tmp_path / "parquet"
+    raw_dir = tmp_path / "raw"
+    # The directories passed to publish_snapshot must win over the defaults
+    monkeypatch.setattr(db, "PARQUET_DIR", tmp_path / "elsewhere")
+    monkeypatch.setattr(db, "RAW_PARQUET_DIR", tmp_path / "elsewhere")
+    _write(parquet_dir / "유초중등학생현황" / "2009.parquet", 30)
+    _write(raw_dir / "0004. 유초중등학생현황(09-23)(100%).parquet", 60)
+
+    path = snapshot.publish_snapshot(tmp_path / "snap", parquet_dir=parquet_dir, raw_dir=raw_dir)
+
+    reader = snapshot.SnapshotReader(tmp_path / "snap")
+    assert reader.path == path
+    assert reader.sql('SELECT COUNT(*) FROM "유초중등학생현황"').fetchone()[0] == 30
+    assert reader.sql('SELECT COUNT(*) FROM history."유초중등학생현황"').fetchone()[0] == 60
+    history = db.school_history(5, reader.connection)
+    assert list(history["유초중등학생현황"]["학교ID"]) == [5]
+
+
+def test_snapshot_stores_processed_and_raw_stats(tmp_path):
+    parquet_dir = tmp_path / "parquet"
+    raw_dir = tmp_path / "raw"
+    _write(parquet_dir / "학교기본정보" / "2026.parquet", 30)
+    _write(raw_dir / "0004. 유초중등학생현황(09-23)(100%).parquet", 60)
+
+    snapshot.publish_snapshot(tmp_path / "snap", parquet_dir=parquet_dir, raw_dir=raw_dir)
+
+    reader = snapshot.SnapshotReader(tmp_path / "snap")
+    assert reader.stats("학교기본정보")["row_count"] == 30
+    assert reader.stats("유초중등학생현황", raw=True)["row_count"] == 60
+    assert reader.stats("유초중등학생현황") is None
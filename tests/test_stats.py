@@ -0,0 +1,105 @@
+"""Tests for schooldata.stats sidecars against known cardinalities."""
+
+import numpy as np
+import pyarrow as pa
+import pytest
+
+from schooldata.stats import (
+    LOW_CARDINALITY,
+    HyperLogLog,
+    _hash_values,
+    compute_stats,
+    merge_stats,
+    read_stats,
+    write_stats,
+)
+
+
+def _hll(values) -> HyperLogLog:
+    hll = HyperLogLog()
+    hll.add_hashes(_hash_values(pa.array(values)))
+    return hll
+
+
+@pytest.mark.parametrize("n", [10, 1_000, 100_000])
+def test_hll_estimate(n):
+    # p=12 has ~1.6% standard error; allow ~4 sigma
+    assert _hll(np.arange(n)).estimate() == pytest.approx(n, rel=0.065)
+
+
+def test_hll_merge_and_roundtrip():
+    a, b = _hll(np.arange(0, 60_000)), _hll(np.arange(40_000, 100_000))
+    a.merge(HyperLogLog.from_json(b.to_json()))
+    assert a.estimate() == pytest.approx(100_000, rel=0.065)
+    with pytest.raises(ValueError):
+        a.merge(HyperLogLog(p=10))
+
+
+def test_hash_values_int_float_agree():
+    assert (_hash_values(pa.array([1, 2, 3])) == _hash_values(pa.array([1.0, 2.0, 3.0]))).all()
+
+
+def test_column_stats():
+    table = pa.table({
+        "region": ["서울특별시", "부산광역시", None, "서울특별시"],
+        "id": pa.array([5, 1, 9, 3], pa.int64()),
+    })
+    cols = compute_stats(table)["columns"]
+    assert cols["region"]["null_count"] == 1
+    assert cols["region"]["distinct"] == ["부산광역시", "서울특별시"]
+    assert (cols["id"]["min"], cols["id"]["max"]) == (1, 9)
+
+    many = compute_stats(pa.table({"id": np.arange(LOW_CARDINALITY + 1)}))["columns"]["id"]
+    assert "distinct" not in many and "hll" in many
+
+
+def test_write_and_read_sidecar(tmp_path):
+    path = tmp_path / "2023.parquet"
+    out = write_stats(pa.table({"x": [1, 2]}), path)
+    assert out.name == "2023.stats.json"
+    assert read_stats(path)["row_count"] == 2
+
+
+def test_merge_distinct_sets():
+    merged = merge_stats([
+        compute_stats(pa.table({"x": [1, 2, 3]})),
+        compute_stats(pa.table({"x": [3, 4, None]})),
+    ])
+    col = merged["columns"]["x"]
+    assert merged["row_count"] == 6
+    assert col["distinct"] == [1, 2, 3, 4]
+    assert col["approx_distinct"] == 4
+    assert (col["null_count"], col["min"], col["max"]) == (1, 1, 4)
+
+
+def test_merge_distinct_overflow_into_hll():
+    half = LOW_CARDINALITY // 2 + 10
+    merged = merge_stats([
+        compute_stats(pa.table({"x": np.arange(0, half)})),
+        compute_stats(pa.table({"x": np.arange(half, 2 * half)})),
+    ])
+    col = merged["columns"]["x"]
+    assert "distinct" not in col
+    assert col["approx_distinct"] == pytest.approx(2 * half, rel=0.065)
+
+
+def test_merge_distinct_with_hll():
+    big = 5_000
+    merged = merge_stats([
+        compute_stats(pa.table({"x": np.arange(big)})),
+        compute_stats(pa.table({"x": np.arange(big, big + 100)})),
+    ])
+    assert merged["columns"]["x"]["approx_distinct"] == pytest.approx(big + 100, rel=0.065)
+
+
+def test_merge_mixed_types():
+    merged = merge_stats([
+        compute_stats(pa.table({"x": pa.array([1, 20], pa.int64())})),
+        compute_stats(pa.table({"x": pa.array(["3", "x"])})),
+        compute_stats(pa.table({"x": pa.array([5, 6], pa.int64())})),
+    ])
+    col = merged["columns"]["x"]
+    assert col["type"] == "int64|string"
+    # int and str bounds compare as text
+    assert (col["min"], col["max"]) == (1, "x")
+    assert col["approx_distinct"] == 6